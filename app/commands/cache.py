@@ -0,0 +1,22 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Author: @spacemany2k38
+# 2026-10-15
+
+from ..core import gh_cache
+from ..utils.logger import get_logger
+
+
+def run(args):
+    """Manage pget's cache of GitHub API responses.
+
+    Usage: pget cache clear
+    """
+    logger = get_logger()
+    if args != ['clear']:
+        logger.error("Usage: pget cache clear")
+        return False
+
+    removed = gh_cache.clear()
+    logger.success(f"Cleared {removed} cached response(s) from {gh_cache.GH_CACHE_DIR}")
+    return True
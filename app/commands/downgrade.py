@@ -7,7 +7,6 @@ from ..core.config import PYNOSAUR_ORG, GITHUB_API
 from ..core.fetcher import GitHubFetcher
 from ..core.installer import Installer
 from ..utils.logger import get_logger
-from ..utils.metadata import get_package_info
 
 
 def _version_tuple(v):
@@ -100,11 +99,11 @@ def run(args):
             # No version specified — show available older versions
             logger = get_logger()
             installer = Installer()
-            if not installer.is_installed(part):
+            state = installer.load_state(part)
+            if not state.installed:
                 logger.error(f"{part} is not installed")
                 return False
-            current_version = installer.get_installed_version(part)
-            return _list_older_versions(part, current_version)
+            return _list_older_versions(part, state.version)
         i += 1
 
     if not targets:
@@ -118,12 +117,13 @@ def run(args):
     overall_success = True
 
     for app_name, target_version in targets:
-        if not installer.is_installed(app_name):
+        state = installer.load_state(app_name)
+        if not state.installed:
             logger.error(f"{app_name} is not installed")
             overall_success = False
             continue
 
-        current_version = installer.get_installed_version(app_name)
+        current_version = state.version
 
         if _version_tuple(target_version) >= _version_tuple(current_version):
             logger.error(
@@ -144,8 +144,7 @@ def run(args):
         # For pget self-downgrade, honour existing install type
         effective_script = script_mode
         if app_name == 'pget' and not script_mode:
-            pkg_info = get_package_info('pget')
-            if pkg_info and pkg_info.get('platform') == 'script':
+            if state.info and state.info.get('platform') == 'script':
                 effective_script = True
 
         installer.uninstall(app_name)
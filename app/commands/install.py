@@ -3,17 +3,24 @@
 # Author: @spacemany2k38
 # 2025-12-24
 
-import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from ..core.config import IGNORED_REPOS
-from ..core.fetcher import GitHubFetcher
-from ..core.installer import Installer
+from ..core.fetcher import GitHubFetcher, warm_dns
+from ..core.installer import Installer, find_bazel
 from ..core.script_installer import install_as_script
+from ..utils.args import parse_names
 from ..utils.platform import get_platform_string
 from ..utils.logger import get_logger
 from ..utils.paths import ensure_path_in_shell, ensure_system_path, link_to_system_bin
 from .. import __version__ as PGET_VERSION
 
+# Network work (repo lookup, marker probe, downloads) for several apps runs
+# concurrently; the filesystem install step stays serial.
+MAX_FETCH_WORKERS = 6
+
+INSTALL_FLAGS = frozenset({'--script', '--build', '--edge', '--no-verify-ssl'})
+
 
 def _parse_names(args):
     """Parse app names with optional version specs.
@@ -22,19 +29,308 @@ def _parse_names(args):
     where version is None for latest or a string like "0.1.0"
     """
     apps = []
-    for a in args:
-        for part in a.split(","):
-            part = part.strip()
-            if part:
-                # Parse app@version syntax
-                if '@' in part:
-                    app_name, version = part.split('@', 1)
-                    apps.append((app_name.strip(), version.strip()))
-                else:
-                    apps.append((part, None))
+    for part in parse_names(args):
+        # Parse app@version syntax
+        app_name, at, version = part.partition('@')
+        apps.append((app_name.strip(), version.strip() if at else None))
     return apps
 
 
+def _download_source(fetcher, app_name, requested_version, edge_mode):
+    """Download and unpack app's source; returns (source_path, version)."""
+    # Don't use edge mode if specific version requested.
+    return fetcher.download_app_directory(
+        app_name,
+        edge=edge_mode and not requested_version,
+        version=requested_version,
+    )
+
+
+def _fetch_app(fetcher, app_name, requested_version, platform, edge_mode,
+               script_mode, build_mode):
+    """Resolve and download everything needed to install one app.
+
+    Runs on a worker thread: only talks to the network and writes to the
+    app's own temp cache directory.
+
+    Returns:
+        dict with keys repo_info, program_ok, binary_path, binary_version,
+        source_path, source_version
+    """
+    fetched = {
+        'repo_info': None,
+        'program_ok': False,
+        'binary_path': None,
+        'binary_version': None,
+        'source_path': None,
+        'source_version': None,
+    }
+
+    # Repo info and the top-level tree target the same repo; fetch together.
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        tree_future = pool.submit(fetcher.get_repo_tree, app_name)
+        fetched['repo_info'] = fetcher.get_repo_info(app_name)
+        tree = tree_future.result()
+
+    # Check if repo exists
+    if not fetched['repo_info']:
+        return fetched
+
+    # Check if repo has .program marker (indicates it's an installable app)
+    fetched['program_ok'] = tree is not None and ".program" in tree
+    if not fetched['program_ok']:
+        return fetched
+
+    want_binary = not script_mode and not build_mode
+
+    def download_source():
+        return _download_source(fetcher, app_name, requested_version, edge_mode)
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        # With a doc/ directory the source is needed whether or not a binary
+        # turns up, so download both at once.
+        source_future = None
+        if want_binary and "doc" in tree:
+            source_future = pool.submit(download_source)
+
+        # Skip binary download if --script or --build flag is set
+        if want_binary:
+            binary_result = fetcher.download_binary(
+                app_name,
+                platform,
+                version=requested_version,
+            )
+            if binary_result and binary_result[0]:
+                fetched['binary_path'], fetched['binary_version'] = binary_result
+
+        # Without a binary, source is needed to build or run as a script.
+        if source_future is not None:
+            source_result = source_future.result()
+        elif not fetched['binary_path']:
+            source_result = download_source()
+        else:
+            source_result = None
+
+    if source_result and source_result[0]:
+        fetched['source_path'], fetched['source_version'] = source_result
+
+    return fetched
+
+
+def _expose_pget():
+    """Put a freshly installed pget on PATH and report how to reach it."""
+    logger = get_logger()
+    ensure_path_in_shell()
+    ensure_system_path()
+    if link_to_system_bin("pget"):
+        logger.info("Linked pget to /usr/local/bin (available now).")
+    else:
+        logger.info("Added ~/.pget/bin to PATH. Open a new shell to use 'pget'.")
+
+
+def _has_bazel_project(source_path):
+    """Return True if source_path can be built with Bazel."""
+    return (
+        (source_path / "MODULE.bazel").exists() or
+        (source_path / "BUILD").exists()
+    )
+
+
+def _install_from_source(installer, source_path, app_name, version, source_url,
+                         platform, script_mode, build_mode):
+    """Install from a source tree: as a script, or built with Bazel+Nuitka.
+
+    --script always installs the script wrapper and --build always builds.
+    Otherwise Bazel is used when it is installed and the source has a Bazel
+    project; if not, or if that build fails, the app falls back to a
+    script install.
+    """
+    logger = get_logger()
+
+    if script_mode:
+        logger.info("Installing as Python script (no compilation)")
+        return install_as_script(source_path, app_name, version, source_url)
+
+    bazel = find_bazel()
+    if build_mode:
+        if not bazel:
+            logger.error("--build requires Bazel but it's not installed")
+            logger.info("Install Bazel or use: pget install --script %s", app_name)
+            return False
+        logger.info("Building from source with Bazel+Nuitka (--build mode)")
+    elif bazel and _has_bazel_project(source_path):
+        logger.info("No release binary found; building with Bazel+Nuitka")
+    else:
+        logger.info("No binary available; installing as Python script")
+        return install_as_script(source_path, app_name, version, source_url)
+
+    success = installer.install_with_bazel(
+        source_path=source_path,
+        app_name=app_name,
+        version=version,
+        source_url=source_url,
+        platform=platform,
+    )
+    if success or build_mode:
+        return success
+
+    logger.info("Bazel build failed; installing as Python script")
+    return install_as_script(source_path, app_name, version, source_url)
+
+
+def _install_pget_self(fetcher, installer, platform, edge_mode, script_mode,
+                       build_mode):
+    """Install pget from the local repo.
+
+    Order: release binary, local Bazel, script.
+    """
+    logger = get_logger()
+    logger.info("Installing pget")
+    app_name = "pget"
+    source_path = Path(__file__).resolve().parents[2]
+    success = False
+
+    if not script_mode and not build_mode:
+        binary_result = fetcher.download_binary(
+            app_name,
+            platform,
+            version=None,
+        )
+        if binary_result and binary_result[0]:
+            binary_path, version = binary_result
+            logger.debug("Downloading source for documentation")
+            source_result = fetcher.download_app_directory(
+                app_name,
+                edge=edge_mode,
+                version=None,
+            )
+            doc_source_path = source_result[0] if source_result else None
+            repo_info = fetcher.get_repo_info(app_name)
+            success = installer.install_binary(
+                binary_path=binary_path,
+                app_name=app_name,
+                version=version,
+                source_url=repo_info.get("html_url", "") if repo_info else "",
+                platform=platform,
+            )
+            if success and doc_source_path:
+                installer.install_doc_files(doc_source_path, app_name)
+
+    if not success:
+        success = _install_from_source(
+            installer,
+            source_path,
+            app_name,
+            PGET_VERSION,
+            str(source_path),
+            platform,
+            script_mode,
+            build_mode,
+        )
+
+    if success:
+        _expose_pget()
+    return success
+
+
+def _report_installed(app_name, current_version, release):
+    """Report an already-installed app, mentioning a newer release if any."""
+    logger = get_logger()
+    if release:
+        latest_version = release.get("tag_name", "unknown").lstrip('v')
+        if (
+            latest_version != current_version and
+            latest_version != "unknown"
+        ):
+            logger.info(
+                "%s is already installed (%s) \u2014 %s is available, run "
+                "'pget update %s'",
+                app_name, current_version, latest_version, app_name,
+            )
+            return
+    logger.info("%s is already installed (%s)", app_name, current_version)
+
+
+def _install_fetched(installer, fetcher, app_name, requested_version, fetched,
+                     platform, edge_mode, script_mode, build_mode, replace=False):
+    """Install one app from the artifacts downloaded by _fetch_app.
+
+    With replace, the installed version is uninstalled first, but only once
+    the new one has been downloaded. If the binary fails to install and no
+    source was fetched with it, the source is downloaded then.
+    """
+    logger = get_logger()
+
+    repo_info = fetched['repo_info']
+    if not repo_info:
+        logger.error("Package '%s' not found in pynosaur organization", app_name)
+        return False
+
+    if not fetched['program_ok']:
+        logger.error(
+            "'%s' is not an installable program (missing .program marker)",
+            app_name,
+        )
+        logger.info(
+            "This repository may be a website "
+            "or documentation-only repo",
+        )
+        return False
+
+    source_url = repo_info.get("html_url", "")
+    source_path = fetched['source_path']
+    success = False
+
+    if not fetched['binary_path'] and not source_path:
+        logger.error("Failed to download %s", app_name)
+        return False
+
+    if replace:
+        installer.uninstall(app_name, keep_downloads=True)
+
+    if fetched['binary_path']:
+        # Install binary
+        success = installer.install_binary(
+            binary_path=fetched['binary_path'],
+            app_name=app_name,
+            version=fetched['binary_version'],
+            source_url=source_url,
+            platform=platform,
+        )
+
+        # Install documentation if source was downloaded
+        if success and source_path:
+            installer.install_doc_files(source_path, app_name)
+
+    if not success:
+        if not source_path:
+            source_result = _download_source(
+                fetcher, app_name, requested_version, edge_mode,
+            )
+            if source_result and source_result[0]:
+                source_path, fetched['source_version'] = source_result
+        if not source_path:
+            logger.error("Failed to download %s", app_name)
+            return False
+
+        success = _install_from_source(
+            installer,
+            source_path,
+            app_name,
+            fetched['source_version'],
+            source_url,
+            platform,
+            script_mode,
+            build_mode,
+        )
+
+    # Add PATH for pget install
+    if app_name == "pget" and success:
+        _expose_pget()
+
+    return success
+
+
 def run(args):
     """Install one or more packages.
 
@@ -48,25 +344,18 @@ def run(args):
         )
         return False
 
-    # Check for --script flag (accept anywhere in args)
-    script_mode = False
-    if '--script' in args:
-        script_mode = True
-        args = [a for a in args if a != '--script']
-        if not args:
-            logger = get_logger()
-            logger.error("Usage: pget install --script <app_name>[,app2...]")
-            return False
-
-    # Check for --build flag (accept anywhere in args)
-    build_mode = False
-    if '--build' in args:
-        build_mode = True
-        args = [a for a in args if a != '--build']
-        if not args:
-            logger = get_logger()
-            logger.error("Usage: pget install --build <app_name>[,app2...]")
-            return False
+    # Split flags (accepted anywhere in args) from app specs in one pass
+    flags = set()
+    positional = []
+    for a in args:
+        if a in INSTALL_FLAGS:
+            flags.add(a)
+        else:
+            positional.append(a)
+    script_mode = '--script' in flags
+    build_mode = '--build' in flags
+    edge_mode = '--edge' in flags
+    no_verify_ssl = '--no-verify-ssl' in flags
 
     # --build and --script are mutually exclusive
     if script_mode and build_mode:
@@ -77,26 +366,7 @@ def run(args):
         )
         return False
 
-    # Check for --edge flag (accept anywhere in args)
-    edge_mode = False
-    if '--edge' in args:
-        edge_mode = True
-        args = [a for a in args if a != '--edge']
-        if not args:
-            logger = get_logger()
-            logger.error("Usage: pget install --edge <app_name>[,app2...]")
-            return False
-
-    # Check for --no-verify-ssl flag (accept anywhere in args)
-    no_verify_ssl = False
-    if '--no-verify-ssl' in args:
-        no_verify_ssl = True
-        args = [a for a in args if a != '--no-verify-ssl']
-
-    names = _parse_names(args)
-    # Guard against stray flag tokens
-    names = [n for n
-        in names if n not in ('--script', '--edge', '--build', '--no-verify-ssl')]
+    names = _parse_names(positional)
     if not names:
         logger = get_logger()
         logger.error(
@@ -105,202 +375,100 @@ def run(args):
         )
         return False
 
+    return install_apps(
+        names,
+        script_mode=script_mode,
+        build_mode=build_mode,
+        edge_mode=edge_mode,
+        no_verify_ssl=no_verify_ssl,
+    )
+
+
+def install_apps(names, script_mode=False, build_mode=False, edge_mode=False,
+                 no_verify_ssl=False, replace=()):
+    """Install the (app_name, version) pairs in names.
+
+    Apps in replace are reinstalled at the requested (or latest) version
+    even if installed, as `pget update` does. Like an app@version reinstall,
+    the old version is only removed once the new one has been downloaded.
+    """
     logger = get_logger()
+    # Overlap name resolution with fetcher setup and install planning.
+    warm_dns()
     fetcher = GitHubFetcher(verify_ssl=not no_verify_ssl)
     installer = Installer()
+    platform = get_platform_string()
     overall_success = True
 
-    for app_spec in names:
-        # Unpack app name and optional version
-        app_name, requested_version = (
-            app_spec
-            if isinstance(app_spec, tuple)
-            else (app_spec, None)
-        )
+    # Phase 1 (serial, cheap): decide what each requested app needs.
+    registry = installer.load_registry(app_name for app_name, _ in names)
+    plan = []
+    seen = set()
+    for app_name, requested_version in names:
+        if app_name in seen:
+            continue
+        seen.add(app_name)
 
-        if app_name in IGNORED_REPOS:
+        if app_name.lower() in IGNORED_REPOS:
             logger.info(
-                f"Skipping non-installable repo '{app_name}' (marked as webpage)",
+                "Skipping non-installable repo '%s' (marked as webpage)",
+                app_name,
             )
             overall_success = False
             continue
 
         # Special-case installing pget itself from the local repo (only if no
-        # specific version requested). Order: release binary, local Bazel, script.
+        # specific version requested).
         if app_name == "pget" and not requested_version:
-            logger.info("Installing pget")
-            source_path = Path(__file__).resolve().parents[2]
-            platform = get_platform_string()
-            repo_info = fetcher.get_repo_info(app_name)
-            source_url = repo_info.get("html_url", "") if repo_info else ""
-            module_bazel = source_path / "MODULE.bazel"
-            build_file = source_path / "BUILD"
-            has_bazel_project = module_bazel.exists() or build_file.exists()
-            success = False
-
-            if script_mode:
-                logger.info(
-                    "Installing pget from local tree as Python script (--script)",
-                )
-                success = install_as_script(
-                    source_path,
-                    app_name,
-                    PGET_VERSION,
-                    str(source_path),
-                )
-            elif build_mode:
-                logger.info(
-                    "Building pget from local source with Bazel+Nuitka (--build)",
-                )
-                success = installer.install_with_bazel(
-                    source_path=source_path,
-                    app_name=app_name,
-                    version=PGET_VERSION,
-                    source_url=str(source_path),
-                    platform=platform,
-                )
-            else:
-                binary_result = fetcher.download_binary(
-                    app_name,
-                    platform,
-                    version=None,
-                )
-                if binary_result and binary_result[0]:
-                    binary_path, version = binary_result
-                    logger.debug("Downloading source for documentation")
-                    use_edge = edge_mode and not requested_version
-                    source_result = fetcher.download_app_directory(
-                        app_name,
-                        edge=use_edge,
-                        version=None,
-                    )
-                    doc_source_path = source_result[0] if source_result else None
-                    success = installer.install_binary(
-                        binary_path=binary_path,
-                        app_name=app_name,
-                        version=version,
-                        source_url=source_url,
-                        platform=platform,
-                    )
-                    if success and doc_source_path:
-                        installer.install_doc_files(doc_source_path, app_name)
-
-                if not success:
-                    bazel = shutil.which("bazelisk") or shutil.which("bazel")
-                    if bazel and has_bazel_project:
-                        logger.info(
-                            "No usable release binary; building pget from local "
-                            "source with Bazel+Nuitka",
-                        )
-                        success = installer.install_with_bazel(
-                            source_path=source_path,
-                            app_name=app_name,
-                            version=PGET_VERSION,
-                            source_url=str(source_path),
-                            platform=platform,
-                        )
-
-                if not success:
-                    logger.info(
-                        "Installing pget from local tree as Python script "
-                        "(no binary for this platform or download failed; "
-                        "no Bazel build)",
-                    )
-                    success = install_as_script(
-                        source_path,
-                        app_name,
-                        PGET_VERSION,
-                        str(source_path),
-                    )
-
-            overall_success = overall_success and success
-            if app_name == "pget" and success:
-                ensure_path_in_shell()
-                ensure_system_path()
-                if link_to_system_bin(app_name):
-                    logger.info(f"Linked pget to /usr/local/bin (available now).")
-                else:
-                    logger.info(
-                        "Added ~/.pget/bin to PATH. Open a new shell to use 'pget'.",
-                    )
+            plan.append({'action': 'self', 'app_name': app_name})
             continue
 
         # Check if already installed and get available version
-        if installer.is_installed(app_name):
-            current_version = installer.get_installed_version(app_name)
+        replacing = app_name in registry
+        if replacing and app_name not in replace:
+            current_version = registry[app_name]
+
+            # No specific version requested: just report (and check updates)
+            if not requested_version:
+                plan.append({
+                    'action': 'installed',
+                    'app_name': app_name,
+                    'current_version': current_version,
+                })
+                overall_success = False
+                continue
 
             # Allow reinstall if specific version is requested
-            if requested_version:
-                requested_tag = (
-                    f"v{requested_version}"
-                    if not requested_version.startswith('v')
-                    else requested_version
-                )
-                current_tag = (
-                    f"v{current_version}"
-                    if not current_version.startswith('v')
-                    else current_version
-                )
+            requested_tag = (
+                f"v{requested_version}"
+                if not requested_version.startswith('v')
+                else requested_version
+            )
+            current_tag = (
+                f"v{current_version}"
+                if not current_version.startswith('v')
+                else current_version
+            )
 
-                if requested_tag == current_tag:
-                    logger.warning(
-                        f'{app_name} {requested_version} is already installed',
-                    )
-                    logger.info(
-                        "Use 'pget remove' to uninstall first if you want to reinstall",
-                    )
-                    overall_success = False
-                    continue
-                else:
-                    logger.info(
-                        f'Replacing {app_name} {current_version} with '
-                        f'{requested_version}'
-                    )
-                    installer.uninstall(app_name)
-                    # Continue with installation
-            else:
-                # No specific version requested, check for updates
-                from ..utils.metadata import get_package_info
-                pkg_info = get_package_info(app_name)
-                install_type = (
-                    pkg_info.get('platform', 'unknown')
-                    if pkg_info
-                    else 'unknown'
+            if requested_tag == current_tag:
+                logger.warning(
+                    '%s %s is already installed', app_name, requested_version,
                 )
-
-                type_msg = (
-                    "script version"
-                    if install_type == 'script'
-                    else "binary version"
+                logger.info(
+                    "Use 'pget remove' to uninstall first if you want to reinstall",
                 )
-
-                # Check for newer version
-                release = fetcher.get_latest_release(app_name)
-                if release:
-                    latest_version = release.get("tag_name", "unknown").lstrip('v')
-                    if (
-                        latest_version != current_version and
-                        latest_version != "unknown"
-                    ):
-                        logger.info(
-                            f"{app_name} is already installed ({current_version}) "
-                            f"\u2014 {latest_version} is available, run "
-                            f"'pget update {app_name}'"
-                        )
-                    else:
-                        logger.info(
-                            f"{app_name} is already installed ({current_version})"
-                        )
-                else:
-                    logger.info(
-                        f"{app_name} is already installed ({current_version})"
-                    )
                 overall_success = False
                 continue
 
-        logger.info(f"Installing {app_name}")
+            logger.info(
+                'Replacing %s %s with %s',
+                app_name, current_version, requested_version,
+            )
+            # Uninstalled in phase 3, once the new version is downloaded
+
+        logger.info("Installing %s", app_name)
         if requested_version:
-            logger.info(f"Requesting version {requested_version}")
+            logger.info("Requesting version %s", requested_version)
             if edge_mode:
                 logger.warning("--edge ignored when specific version is requested")
         elif edge_mode:
@@ -308,149 +476,61 @@ def run(args):
         if build_mode:
             logger.info("Using --build mode (compile from source)")
 
-        # Check if repo exists
-        repo_info = fetcher.get_repo_info(app_name)
-        if not repo_info:
-            logger.error(f"Package '{app_name}' not found in pynosaur organization")
-            overall_success = False
-            continue
-
-        # Check if repo has .program marker (indicates it's an installable app)
-        program_url = (
-            f"{fetcher.raw_base}/{fetcher.org}"
-            f"/{app_name}/main/.program"
-        )
-        if not fetcher.url_exists(program_url):
-            logger.error(
-                f"'{app_name}' is not an installable program "
-                f"(missing .program marker)",
-            )
-            logger.info(
-                "This repository may be a website "
-                "or documentation-only repo",
-            )
-            overall_success = False
-            continue
-
-        platform = get_platform_string()
-        source_url = repo_info.get("html_url", "")
-
-        success = False
-        installed_version = None
-        install_platform = None
-
-        # Skip binary download if --script or --build flag is set
-        if not script_mode and not build_mode:
-            # Try to download binary first (release asset)
-            binary_result = fetcher.download_binary(
-                app_name,
-                platform,
-                version=requested_version,
-            )
-            if binary_result and binary_result[0]:
-                binary_path, version = binary_result
-
-                # Also download source for documentation
-                logger.debug("Downloading source for documentation")
-                # Don't use edge mode if specific version requested
-                use_edge = edge_mode and not requested_version
-                source_result = fetcher.download_app_directory(
-                    app_name,
-                    edge=use_edge,
-                    version=requested_version,
+        plan.append({
+            'action': 'install',
+            'app_name': app_name,
+            'version': requested_version,
+            'replace': replacing,
+        })
+
+    # Phase 2 (concurrent): network lookups and downloads for every app.
+    # Phase 3 (serial): install in the order requested as soon as each app's
+    # downloads are in, while later apps are still fetching; installs share
+    # ~/.pget and must not interleave.
+    with ThreadPoolExecutor(max_workers=MAX_FETCH_WORKERS) as pool:
+        futures = {}
+        for idx, item in enumerate(plan):
+            if item['action'] == 'install':
+                futures[idx] = pool.submit(
+                    _fetch_app,
+                    fetcher,
+                    item['app_name'],
+                    item['version'],
+                    platform,
+                    edge_mode,
+                    script_mode,
+                    build_mode,
                 )
-                source_path = source_result[0] if source_result else None
-
-                # Install binary
-                success = installer.install_binary(
-                    binary_path=binary_path,
-                    app_name=app_name,
-                    version=version,
-                    source_url=source_url,
-                    platform=platform,
+            elif item['action'] == 'installed':
+                futures[idx] = pool.submit(
+                    fetcher.get_latest_release, item['app_name'],
                 )
-                installed_version = version
-                install_platform = platform
 
-                # Install documentation if source was downloaded
-                if success and source_path:
-                    installer.install_doc_files(source_path, app_name)
+        for idx, item in enumerate(plan):
+            app_name = item['app_name']
 
-        if not success:
-            # Download source
-            # Don't use edge mode if specific version requested
-            use_edge = edge_mode and not requested_version
-            source_result = fetcher.download_app_directory(
-                app_name,
-                edge=use_edge,
-                version=requested_version,
-            )
-            if not source_result or not source_result[0]:
-                logger.error(f"Failed to download {app_name}")
+            if item['action'] == 'self':
+                success = _install_pget_self(
+                    fetcher, installer, platform, edge_mode, script_mode, build_mode,
+                )
+                overall_success = overall_success and success
+                continue
+
+            try:
+                result = futures[idx].result()
+            except Exception as e:
+                logger.error("Failed to fetch %s: %s", app_name, e)
                 overall_success = False
                 continue
 
-            source_path, version = source_result
-
-            # Install as script if requested
-            if script_mode:
-                logger.info("Installing as Python script (no compilation)")
-                success = install_as_script(source_path, app_name, version, source_url)
-                installed_version = version
-                install_platform = "script"
-            # Build from source if requested or no binary available
-            else:
-                # Check if Bazel is available
-                bazel = shutil.which("bazelisk") or shutil.which("bazel")
-                if not bazel:
-                    if build_mode:
-                        logger.error("--build requires Bazel but it's not installed")
-                        logger.info("Install Bazel or use: pget install --script <app>")
-                        overall_success = False
-                        continue
-
-                    logger.info("No binary available; installing as Python script")
-                    success = install_as_script(
-                        source_path,
-                        app_name,
-                        version,
-                        source_url,
-                    )
-                    installed_version = version
-                    install_platform = "script"
-                else:
-                    # Build with Bazel
-                    if build_mode:
-                        logger.info(
-                            "Building from source with Bazel+Nuitka (--build mode)"
-                        )
-                    else:
-                        logger.info(
-                            "No release binary found; building with Bazel+Nuitka"
-                        )
-                    success = installer.install_with_bazel(
-                        source_path=source_path,
-                        app_name=app_name,
-                        version=version,
-                        source_url=source_url,
-                        platform=platform,
-                    )
-                    installed_version = version
-                    install_platform = platform
-
-        # Add PATH for pget install
-        if app_name == "pget" and success:
-            ensure_path_in_shell()
-            ensure_system_path()
-            if link_to_system_bin(app_name):
-                logger.info(f"Linked pget to /usr/local/bin (available now).")
-            else:
-                logger.info(
-                    "Added ~/.pget/bin to PATH. "
-                    "Open a new shell to use 'pget'.",
-                )
+            if item['action'] == 'installed':
+                _report_installed(app_name, item['current_version'], result)
+                continue
 
-        overall_success = overall_success and success
+            success = _install_fetched(
+                installer, fetcher, app_name, item['version'], result, platform,
+                edge_mode, script_mode, build_mode, replace=item['replace'],
+            )
+            overall_success = overall_success and success
 
     return overall_success
-
@@ -3,9 +3,11 @@
 # Author: @spacemany2k38
 # 2025-12-24
 
+import os
+import sys
 from ..utils.paths import PGET_BIN
 from ..utils.logger import get_logger
-from ..utils.metadata import get_package_version
+from ..utils.metadata import get_all_package_versions
 from ..core.script_installer import PGET_SCRIPTS, LEGACY_SCRIPTS
 
 
@@ -19,42 +21,55 @@ def run(args):
     # Check scripts first
     scripts = set()
     for script_dir in (PGET_SCRIPTS, LEGACY_SCRIPTS):
-        if script_dir.exists():
-            for f in script_dir.iterdir():
-                if f.is_dir():
-                    scripts.add(f.name)
-    scripts = sorted(scripts)
+        try:
+            with os.scandir(script_dir) as entries:
+                scripts.update(
+                    e.name for e in entries if e.is_dir(follow_symlinks=False)
+                )
+        except FileNotFoundError:
+            pass
 
     # Check binaries (exclude script wrappers and backups)
     binaries = []
-    if PGET_BIN.exists():
-        for f in PGET_BIN.iterdir():
-            if f.is_file() and not f.name.startswith('.'):
-                # Skip backup files and script wrappers
-                if f.name.endswith('.old') or f.name.endswith('.bak'):
+    try:
+        with os.scandir(PGET_BIN) as entries:
+            for e in entries:
+                name = e.name
+                # Skip hidden files, backup files and script wrappers
+                if name.startswith('.') or name.endswith(('.old', '.bak')):
                     continue
-                if f.name not in scripts:
-                    binaries.append(f.name)
-        binaries = sorted(binaries)
+                if name not in scripts and e.is_file():
+                    binaries.append(name)
+    except FileNotFoundError:
+        pass
+    binaries.sort()
+    scripts = sorted(scripts)
 
     if not binaries and not scripts:
         logger.info("No packages installed")
         return True
 
+    versions = get_all_package_versions()
+
+    # Build the whole listing, then write it once
+    lines = []
     if binaries:
-        print(f"Installed packages in {PGET_BIN}:")
-        print()
+        lines.append(f"Installed packages in {PGET_BIN}:")
+        lines.append("")
         for name in binaries:
-            version = get_package_version(name)
-            print(f"  {name:<20} {version}")
+            version = versions.get(name, 'unknown')
+            lines.append(f"  {name:<20} {version}")
 
     if scripts:
         if binaries:
-            print()
-        print(f"Installed scripts in {PGET_SCRIPTS}:")
-        print()
+            lines.append("")
+        lines.append(f"Installed scripts in {PGET_SCRIPTS}:")
+        lines.append("")
         for name in scripts:
-            version = get_package_version(name)
-            print(f"  {name:<20} {version}  [script]")
+            version = versions.get(name, 'unknown')
+            lines.append(f"  {name:<20} {version}  [script]")
+
+    lines.append("")
+    sys.stdout.write("\n".join(lines))
 
     return True
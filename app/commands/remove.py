@@ -4,17 +4,9 @@
 # 2025-12-24
 
 from ..core.installer import Installer
+from ..utils.args import parse_names
 from ..utils.logger import get_logger
-
-
-def _parse_names(args):
-    names = []
-    for a in args:
-        for part in a.split(","):
-            part = part.strip()
-            if part:
-                names.append(part)
-    return names
+from ..utils.paths import clear_download_dir
 
 
 def run(args):
@@ -23,7 +15,7 @@ def run(args):
     Usage: pget remove <app1>[,app2...] | pget remove app1 app2 ...
     """
     logger = get_logger()
-    names = _parse_names(args)
+    names = parse_names(args)
     if not names:
         logger.error("Usage: pget remove <app_name>[,app2...]")
         return False
@@ -32,6 +24,9 @@ def run(args):
     overall = True
     for name in names:
         ok = installer.uninstall(name)
+        if ok:
+            # Not done by uninstall(): reinstalls reuse the cached asset
+            clear_download_dir(name)
         overall = overall and ok
     return overall
 
@@ -3,10 +3,17 @@
 # Author: @spacemany2k38
 # 2025-12-24
 
-from ..core.config import PYNOSAUR_ORG, GITHUB_API, GITHUB_RAW
+from concurrent.futures import ThreadPoolExecutor
+from ..core.config import IGNORED_REPOS, PYNOSAUR_ORG, GITHUB_RAW
 from ..core.fetcher import GitHubFetcher
 from ..utils.logger import get_logger
 
+# .program probes are independent HEAD requests; run them side by side.
+MAX_PROBE_WORKERS = 16
+
+# Repeated searches within a few minutes reuse the repo list and probes.
+SEARCH_TTL = 5 * 60
+
 
 def run(args):
     """Search for packages in pynosaur organization.
@@ -16,8 +23,7 @@ def run(args):
     logger = get_logger()
     fetcher = GitHubFetcher()
 
-    url = f"{GITHUB_API}/orgs/{PYNOSAUR_ORG}/repos?per_page=100"
-    repos = fetcher.fetch_json(url)
+    repos = fetcher.list_repos(ttl=SEARCH_TTL)
 
     if repos is None:
         logger.error("Failed to fetch packages")
@@ -29,21 +35,29 @@ def run(args):
 
     query = args[0].lower() if args else None
 
-    if query:
-        repos = [
-            r for r in repos
-            if query in r["name"].lower()
-            or query in r.get("description", "").lower()
-        ]
+    # Drop known non-packages and non-matches before probing or sorting
+    repos = [
+        r for r in repos
+        if r["name"].lower() not in IGNORED_REPOS and (
+            not query
+            or query in r["name"].lower()
+            or query in (r.get("description") or "").lower()
+        )
+    ]
 
-    installable_repos = []
-    for repo in repos:
+    def has_marker(repo):
         marker_url = (
             f"{GITHUB_RAW}/{PYNOSAUR_ORG}"
             f"/{repo['name']}/main/.program"
         )
-        if fetcher.url_exists(marker_url):
-            installable_repos.append(repo)
+        return fetcher.head(marker_url, ttl=SEARCH_TTL)
+
+    installable_repos = []
+    if repos:
+        workers = min(MAX_PROBE_WORKERS, len(repos))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            flags = list(pool.map(has_marker, repos))
+        installable_repos = [r for r, ok in zip(repos, flags) if ok]
 
     if not installable_repos:
         logger.info(
@@ -3,14 +3,24 @@
 # Author: @spacemany2k38
 # 2025-12-24
 
-import re
-import shutil
-from pathlib import Path
+import os
+from concurrent.futures import ThreadPoolExecutor
 from ..core.fetcher import GitHubFetcher
 from ..core.installer import Installer
+from ..core.script_installer import install_as_script, PGET_SCRIPTS, LEGACY_SCRIPTS
+from ..utils.args import parse_names
+from ..utils.fastcopy import fast_copy
 from ..utils.logger import get_logger
-from ..utils.paths import get_binary_path, get_doc_dir, find_existing_binary
+from ..utils.metadata import read_doc_version, save_package_info
+from ..utils.paths import (
+    PGET_BIN, get_binary_path, get_doc_dir,
+    ensure_path_in_shell, ensure_system_path, link_to_system_bin,
+)
 from ..utils.platform import get_platform_string
+from .install import install_apps
+
+# Latest-release lookups for the packages being updated run side by side.
+MAX_RELEASE_WORKERS = 8
 
 
 def _version_tuple(v):
@@ -24,15 +34,12 @@ def _version_tuple(v):
 def _ensure_helpers(app_name, expected_version, fetcher, installer, logger):
     """Refresh helper docs if missing or stale."""
     doc_yaml = get_doc_dir(app_name) / f"{app_name}.yaml"
-    if doc_yaml.exists():
-        try:
-            content = doc_yaml.read_text(encoding="utf-8")
-            m = re.search(r'^VERSION:\s*"?([^"\n]+)', content, re.M)
-            if m and m.group(1).strip() == str(expected_version):
-                return
-        except OSError:
-            pass
-    logger.debug(f"Refreshing helper docs for {app_name}")
+    try:
+        if read_doc_version(doc_yaml) == str(expected_version):
+            return
+    except OSError:
+        pass
+    logger.debug("Refreshing helper docs for %s", app_name)
     source_result = fetcher.download_app_directory(
         app_name, version=str(expected_version),
     )
@@ -49,17 +56,12 @@ def update_pget_self(
     build_mode=False,
 ):
     """Update pget itself (special handling for self-update)."""
-    from ..core.script_installer import install_as_script
-    from ..utils.platform import get_platform_string
-    from pathlib import Path
-
-    from ..utils.metadata import get_package_info
-
-    current_version = installer.get_installed_version('pget')
-    current_binary = find_existing_binary('pget') or get_binary_path('pget')
+    state = installer.load_state('pget')
+    current_version = state.version
+    current_binary = state.binary or get_binary_path('pget')
 
     # If pget was installed as a script, always use script mode for self-update
-    pkg_info = get_package_info('pget')
+    pkg_info = state.info
     if not script_mode and pkg_info and pkg_info.get('platform') == 'script':
         script_mode = True
 
@@ -114,10 +116,6 @@ def update_pget_self(
             'https://github.com/pynosaur/pget',
         )
         if ok:
-            from ..utils.paths import (
-                ensure_path_in_shell, ensure_system_path,
-                link_to_system_bin,
-            )
             ensure_path_in_shell()
             ensure_system_path()
             link_to_system_bin('pget')
@@ -134,25 +132,20 @@ def update_pget_self(
             if binary_result and binary_result[0]:
                 new_binary_path, _ = binary_result
 
-                # Backup and replace strategy
-                backup_path = current_binary.parent / "pget.old"
+                # Stage the new binary next to the real file (not a
+                # /usr/local/bin symlink pointing at it), then rename it
+                # over the old one: a single atomic step, so there is never
+                # a moment without a working pget. A running binary can be
+                # replaced this way on POSIX.
+                target = current_binary.resolve()
+                staged = target.parent / ".pget.new"
                 try:
-                    # Make current binary writable
-                    if current_binary.exists():
-                        current_binary.chmod(0o755)
-                        shutil.copy(current_binary, backup_path)
-                        logger.debug(f"Backed up to {backup_path}")
-
-                    # Replace (unlink first to avoid permission issues)
-                    if current_binary.exists():
-                        current_binary.unlink()
-
-                    shutil.copy(new_binary_path, current_binary)
-                    current_binary.chmod(0o755)
-                    installer._sanitize_binary(current_binary)
+                    # Copy, so the asset stays in the download cache
+                    fast_copy(new_binary_path, staged, 0o755)
+                    installer._sanitize_binary(staged)
+                    os.replace(staged, target)
 
                     # Update metadata
-                    from ..utils.metadata import save_package_info
                     save_package_info(
                         'pget',
                         latest_version,
@@ -166,27 +159,10 @@ def update_pget_self(
 
                     logger.success(f"pget updated to {latest_version}")
                     logger.info("Restart pget to use the new version")
-
-                    # Remove backup immediately if successful
-                    if backup_path.exists():
-                        try:
-                            backup_path.chmod(0o755)  # Ensure writable
-                            backup_path.unlink()
-                            logger.debug("Removed backup file")
-                        except Exception as e:
-                            logger.debug(f"Could not remove backup: {e}")
-
                     return True
                 except Exception as e:
                     logger.error(f"Failed to update: {e}")
-                    # Restore from backup
-                    if backup_path.exists() and not current_binary.exists():
-                        try:
-                            shutil.copy(backup_path, current_binary)
-                            current_binary.chmod(0o755)
-                            logger.info("Restored previous version")
-                        except:
-                            pass
+                    staged.unlink(missing_ok=True)
                     return False
 
     # Build from source if requested or no binary available
@@ -227,9 +203,6 @@ def update_pget_self(
 
 def _get_installed_names():
     """Return sorted list of all installed package names."""
-    from ..utils.paths import PGET_BIN
-    from ..core.script_installer import PGET_SCRIPTS, LEGACY_SCRIPTS
-
     names = set()
     for script_dir in (PGET_SCRIPTS, LEGACY_SCRIPTS):
         if script_dir.exists():
@@ -300,15 +273,6 @@ def run(args):
         no_verify_ssl = True
         args = [a for a in args if a != '--no-verify-ssl']
 
-    def _parse_names(values):
-        res = []
-        for a in values:
-            for part in a.split(","):
-                part = part.strip()
-                if part:
-                    res.append(part)
-        return res
-
     logger = get_logger()
 
     if all_mode:
@@ -317,7 +281,7 @@ def run(args):
             logger.info("No packages installed")
             return True
     else:
-        names = _parse_names(args)
+        names = parse_names(args)
         if not names:
             logger.error(
                 'Usage: pget update [--all|-a] [--script|--build] [--edge] '
@@ -326,31 +290,58 @@ def run(args):
             return False
 
     installer = Installer()
-    fetcher = GitHubFetcher(verify_ssl=not no_verify_ssl)
+    registry = installer.load_registry(names)
     overall = True
 
+    # Report names that aren't installed before touching the network
+    todo = []
     for app_name in names:
-        # Special handling for self-update
-        if app_name == 'pget':
-            ok = update_pget_self(
-                logger,
-                installer,
-                fetcher,
-                edge_mode=edge_mode,
-                script_mode=script_mode,
-                build_mode=build_mode,
-            )
-            overall = overall and ok
+        if app_name == 'pget' or app_name in registry:
+            todo.append(app_name)
             continue
+        logger.error(f"{app_name} is not installed")
+        logger.info(f"Use 'pget install {app_name}' to install it")
+        overall = False
+    if not todo:
+        return overall
 
-        if not installer.is_installed(app_name):
-            logger.error(f"{app_name} is not installed")
-            logger.info(f"Use 'pget install {app_name}' to install it")
-            overall = False
+    fetcher = GitHubFetcher(verify_ssl=not no_verify_ssl)
+
+    # Look up every latest release up front (edge mode skips the check).
+    releases = {}
+    if not edge_mode:
+        to_check = [n for n in todo if n != 'pget']
+        if to_check:
+            workers = min(MAX_RELEASE_WORKERS, len(to_check))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                releases = dict(zip(
+                    to_check, pool.map(fetcher.get_latest_release, to_check),
+                ))
+
+    # pget updates itself first, so the other packages are updated by the
+    # new version.
+    if 'pget' in todo:
+        ok = update_pget_self(
+            logger,
+            installer,
+            fetcher,
+            edge_mode=edge_mode,
+            script_mode=script_mode,
+            build_mode=build_mode,
+        )
+        overall = overall and ok
+
+    # Outdated apps are collected and reinstalled in one install run, which
+    # downloads them concurrently and replaces them one at a time, each only
+    # once its new version is downloaded.
+    to_install = []
+
+    for app_name in todo:
+        if app_name == 'pget':
             continue
 
         # Check current version
-        current_version = installer.get_installed_version(app_name)
+        current_version = registry[app_name]
 
         # In edge mode, always force update from main without version check
         if edge_mode:
@@ -358,23 +349,11 @@ def run(args):
                 f'Updating {app_name} from {current_version} to latest main (--edge '
                 f'mode)'
             )
-            installer.uninstall(app_name)
-
-            from .install import run as install_run
-            install_args = []
-            if edge_mode:
-                install_args.append('--edge')
-            if script_mode:
-                install_args.append('--script')
-            if build_mode:
-                install_args.append('--build')
-            install_args.append(app_name)
-            ok = install_run(install_args)
-            overall = overall and ok
+            to_install.append(app_name)
             continue
 
         # Get latest version from GitHub release
-        release = fetcher.get_latest_release(app_name)
+        release = releases.get(app_name)
         latest_version = None
 
         if release:
@@ -387,20 +366,13 @@ def run(args):
             if source_result and source_result[0]:
                 source_path = source_result[0]
                 doc_file = source_path / "doc" / f"{app_name}.yaml"
-                logger.debug(f"Looking for doc at: {doc_file}")
-                logger.debug(f"Doc exists: {doc_file.exists()}")
-                if doc_file.exists():
-                    import re
-                    content = doc_file.read_text()
-                    logger.debug(f"Doc content length: {len(content)}")
-                    version_match = re.search(
-                        '^VERSION:\\s*"([^"]+)"',
-                        content,
-                        re.MULTILINE,
-                    )
-                    if version_match:
-                        latest_version = version_match.group(1)
-                        logger.debug(f"Found version in doc: {latest_version}")
+                logger.debug("Looking for doc at: %s", doc_file)
+                doc_exists = doc_file.exists()
+                logger.debug("Doc exists: %s", doc_exists)
+                if doc_exists:
+                    latest_version = read_doc_version(doc_file)
+                    if latest_version:
+                        logger.debug("Found version in doc: %s", latest_version)
 
         # Compare versions
         if not latest_version:
@@ -419,17 +391,17 @@ def run(args):
             continue
 
         logger.info(f"Updating {app_name} from {current_version} to {latest_version}")
-        installer.uninstall(app_name)
-
-        from .install import run as install_run
-        install_args = []
-        if script_mode:
-            install_args.append('--script')
-        if build_mode:
-            install_args.append('--build')
-        install_args.append(app_name)
-        ok = install_run(install_args)
+        to_install.append(app_name)
+
+    if to_install:
+        ok = install_apps(
+            [(app_name, None) for app_name in to_install],
+            script_mode=script_mode,
+            build_mode=build_mode,
+            edge_mode=edge_mode,
+            no_verify_ssl=no_verify_ssl,
+            replace=to_install,
+        )
         overall = overall and ok
 
     return overall
-
@@ -3,6 +3,7 @@
 # Author: @spacemany2k38
 # 2026-01-03
 
+import sys
 from ..core.config import PYNOSAUR_ORG, GITHUB_API
 from ..core.fetcher import GitHubFetcher
 from ..utils.logger import get_logger
@@ -36,24 +37,25 @@ def run(args):
         logger.info(f"No releases found for {app_name}")
         return True
 
-    print(f"Available versions for {app_name}:")
-    print()
-
+    # Build the listing and write it once
+    lines = [f"Available versions for {app_name}:", ""]
+    latest_id = releases[0].get("id")
     for release in releases:
-        tag = release.get("tag_name", "")
-        name = release.get("name", "")
-        published = release.get("published_at", "")[:10]  # YYYY-MM-DD
-        is_latest = release.get("id") == releases[0].get("id")
-
-        latest_mark = " (latest)" if is_latest else ""
-        print(f"  {tag:<15} {published}  {name}{latest_mark}")
-
-    print()
-    print(f"Install specific version: pget install {app_name}@<version>")
-    print(
+        tag = release.get("tag_name") or ""
+        name = release.get("name") or ""
+        # Drafts have no publish date
+        published = (release.get("published_at") or "")[:10]  # YYYY-MM-DD
+        latest_mark = " (latest)" if release.get("id") == latest_id else ""
+        lines.append(f"  {tag:<15} {published:<10}  {name}{latest_mark}")
+
+    lines += [
+        "",
+        f"Install specific version: pget install {app_name}@<version>",
         f"Example: pget install "
-        f"{app_name}@{releases[0].get('tag_name', '').lstrip('v')}"
-    )
+        f"{app_name}@{(releases[0].get('tag_name') or '').lstrip('v')}",
+        "",
+    ]
+    sys.stdout.write("\n".join(lines))
 
     return True
 
@@ -8,7 +8,8 @@ GITHUB_API = "https://api.github.com"
 GITHUB_RAW = "https://raw.githubusercontent.com"
 
 # Repos that are not installable packages (e.g., GitHub Pages site).
-IGNORED_REPOS = {
+# Stored lowercased: GitHub repo names are case-insensitive.
+IGNORED_REPOS = frozenset(name.lower() for name in (
     "pynosaur.github.io",
-}
+))
 
@@ -3,17 +3,72 @@
 # Author: @spacemany2k38
 # 2025-12-24
 
+import contextlib
+import datetime
+import functools
+import gzip
+import http.client
 import json
 import os
+import shutil
+import socket
 import ssl
 import tarfile
+import threading
+import time
 import urllib.error
+import urllib.parse
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from .. import __version__ as PGET_VERSION
+from ..security.manifest import sha256_file
 from ..utils.logger import get_logger
-from ..utils.paths import get_cache_path, get_temp_cache_dir
+from ..utils.paths import get_download_dir, get_temp_cache_dir
 from ..utils.platform import get_platform_string
 from .config import GITHUB_API, GITHUB_RAW, PYNOSAUR_ORG
+from .gh_cache import DEFAULT_TTL, cached_get
+
+# Releases change more often than repo metadata; keep `pget update` prompt
+# while still letting a burst of commands share one lookup.
+RELEASE_TTL = 5 * 60
+
+_REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+_MAX_REDIRECTS = 5
+_RETRY_STATUSES = (502, 503, 504)
+_MAX_RETRIES = 3
+_RETRY_BACKOFF = 0.3
+
+# TCP/TLS setup gets its own, shorter limit than reading a response, so an
+# unreachable network fails in seconds rather than after the full timeout.
+CONNECT_TIMEOUT = 5
+
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+# Progress interval (verbose mode) when the size is unknown
+PROGRESS_STEP = 8 * 1024 * 1024
+
+# GitHub's maximum page size for list endpoints
+REPOS_PER_PAGE = 100
+MAX_PAGE_WORKERS = 8
+
+# Downloads are requested in RANGE_PART_SIZE pieces: the first one tells us
+# the total size, the rest are fetched in parallel (a single connection is
+# capped by its congestion window on long-haul CDN links).
+RANGE_PART_SIZE = 4 * 1024 * 1024
+MAX_RANGE_WORKERS = 8
+
+# Hosts an install talks to: the API, plus where tarball and release asset
+# downloads redirect.
+GITHUB_HOSTS = (
+    "api.github.com",
+    "github.com",
+    "codeload.github.com",
+    "objects.githubusercontent.com",
+)
+
+# Keep-alive connections, per thread (http.client is not thread-safe) and
+# shared by every GitHubFetcher in the process.
+_local = threading.local()
 
 _CERT_PATHS = [
     "/etc/ssl/cert.pem",
@@ -25,19 +80,25 @@ _CERT_PATHS = [
 ]
 
 
+@functools.lru_cache(maxsize=2)
 def _build_ssl_context(verify):
-    """Build an SSL context that works across macOS/Linux Python installs."""
+    """Build an SSL context that works across macOS/Linux Python installs.
+
+    Cached per process: building a verified context loads the CA bundle and
+    probes api.github.com, which every GitHubFetcher would otherwise repeat.
+    """
     if not verify:
         return ssl._create_unverified_context()
 
     ctx = ssl.create_default_context()
     try:
-        urllib.request.urlopen(
-            urllib.request.Request("https://api.github.com"),
+        # HEAD: only the TLS handshake matters, not the body
+        with urllib.request.urlopen(
+            urllib.request.Request("https://api.github.com", method="HEAD"),
             timeout=5,
             context=ctx,
-        )
-        return ctx
+        ):
+            return ctx
     except urllib.error.URLError:
         pass
 
@@ -59,6 +120,75 @@ def _build_ssl_context(verify):
     return None
 
 
+def warm_dns(hosts=GITHUB_HOSTS):
+    """Resolve hosts on background threads so later connects skip DNS.
+
+    Only useful where the OS caches lookups (macOS, systemd-resolved, nscd);
+    does nothing behind a proxy, which resolves names itself. Never blocks.
+    """
+    proxies = urllib.request.getproxies()
+    if proxies.get('https') or proxies.get('http'):
+        return
+
+    def resolve(host):
+        try:
+            socket.getaddrinfo(host, 443, type=socket.SOCK_STREAM)
+        except OSError:
+            pass
+
+    for host in hosts:
+        threading.Thread(target=resolve, args=(host,), daemon=True).start()
+
+
+# API responses already fetched by this process, by URL. `pget update`
+# hands over to install with a fresh fetcher; both share these.
+_api_memo = {}
+
+
+class _RangeNotSatisfied(Exception):
+    """The server did not honour a Range request as expected."""
+
+
+def _total_size(response):
+    """Total size of the resource behind response, or None if unknown.
+
+    A 206 reports it after the slash of Content-Range
+    ("bytes 0-4194303/12345678"), a 200 in Content-Length.
+    """
+    if response.status == 206:
+        total = (response.getheader('Content-Range') or '').rpartition('/')[2]
+    else:
+        total = response.getheader('Content-Length') or ''
+    return int(total) if total.isdigit() else None
+
+
+def _is_cached_asset(path, asset):
+    """Whether path already holds the release asset described by asset.
+
+    The size must match. If the release lists a digest ("sha256:<hex>")
+    the file is hashed and compared; otherwise it must be newer than the
+    asset's upload, since legacy unversioned names are reused across
+    releases.
+    """
+    try:
+        st = path.stat()
+    except OSError:
+        return False
+    if st.st_size != asset.get("size"):
+        return False
+
+    algo, _, expected = (asset.get("digest") or "").partition(":")
+    if algo == "sha256":
+        return sha256_file(path) == expected
+    try:
+        uploaded = datetime.datetime.strptime(
+            asset.get("updated_at") or "", "%Y-%m-%dT%H:%M:%SZ",
+        ).replace(tzinfo=datetime.timezone.utc)
+    except ValueError:
+        return False
+    return st.st_mtime >= uploaded.timestamp()
+
+
 class GitHubFetcher:
     """Fetches packages from GitHub pynosaur organization."""
 
@@ -68,6 +198,9 @@ class GitHubFetcher:
         self.api_base = GITHUB_API
         self.raw_base = GITHUB_RAW
         self.verify_ssl = verify_ssl
+        # urllib is used instead of the keep-alive pool behind a proxy.
+        proxies = urllib.request.getproxies()
+        self._use_urllib = bool(proxies.get('https') or proxies.get('http'))
 
         if not verify_ssl:
             self.ssl_context = ssl._create_unverified_context()
@@ -82,76 +215,449 @@ class GitHubFetcher:
                 )
                 self.ssl_context = ssl._create_unverified_context()
 
-    def fetch_json(self, url, timeout=30):
-        """Fetch a URL and return parsed JSON (None on error/404)."""
-        try:
-            req = urllib.request.Request(url)
-            req.add_header('Accept', 'application/vnd.github.v3+json')
+    def _connection(self, scheme, host):
+        """Return this thread's keep-alive connection to host."""
+        conns = getattr(_local, 'conns', None)
+        if conns is None:
+            conns = _local.conns = {}
+        key = (scheme, host, self.verify_ssl)
+        conn = conns.get(key)
+        if conn is None:
+            if scheme == 'https':
+                conn = http.client.HTTPSConnection(
+                    host, context=self.ssl_context,
+                )
+            else:
+                conn = http.client.HTTPConnection(host)
+            conns[key] = conn
+        return conn
+
+    def _begin(self, method, url, headers, timeout):
+        """Send a request on this thread's keep-alive connection.
 
+        Returns:
+            (conn, response) with the response body not yet read
+        """
+        parts = urllib.parse.urlsplit(url)
+        path = parts.path or '/'
+        if parts.query:
+            path += '?' + parts.query
+
+        while True:
+            conn = self._connection(parts.scheme, parts.netloc)
+            reused = conn.sock is not None
+            try:
+                if not reused:
+                    conn.timeout = min(CONNECT_TIMEOUT, timeout)
+                    conn.connect()
+                # timeout bounds each read once connected
+                conn.sock.settimeout(timeout)
+                conn.request(method, path, headers=headers)
+                return conn, conn.getresponse()
+            except (OSError, http.client.HTTPException) as e:
+                conn.close()
+                # The server may have dropped an idle keep-alive connection;
+                # retry once on a fresh one.
+                if not reused:
+                    raise urllib.error.URLError(e)
+
+    def _send(self, method, url, headers, timeout):
+        """Send one request; returns (status, headers, body)."""
+        if self._use_urllib:
+            req = urllib.request.Request(url, headers=headers, method=method)
+            try:
+                with urllib.request.urlopen(
+                    req, timeout=timeout, context=self.ssl_context,
+                ) as response:
+                    return response.status, response.headers, response.read()
+            except urllib.error.HTTPError as e:
+                return e.code, e.headers, e.read()
+
+        conn, response = self._begin(method, url, headers, timeout)
+        try:
+            return response.status, response.headers, response.read()
+        except (OSError, http.client.HTTPException) as e:
+            conn.close()
+            raise urllib.error.URLError(e)
+
+    @contextlib.contextmanager
+    def _open(self, url, timeout=60, headers=None):
+        """Open url for streaming, over a keep-alive connection.
+
+        Follows redirects (release assets and tarballs redirect to other
+        GitHub hosts, which get their own pooled connection).
+
+        Yields:
+            The response, a file-like object with getheader(); its url
+            attribute is the final URL after redirects
+        Raises:
+            urllib.error.HTTPError for a non-2xx final status,
+            urllib.error.URLError on network failure
+        """
+        headers = {'User-Agent': f"pget/{PGET_VERSION}", **(headers or {})}
+        if self._use_urllib:
+            request = urllib.request.Request(url, headers=headers)
             with urllib.request.urlopen(
-                req, timeout=timeout, context=self.ssl_context,
+                request, timeout=timeout, context=self.ssl_context,
             ) as response:
-                return json.loads(response.read().decode())
-        except urllib.error.HTTPError as e:
-            if e.code == 404:
-                return None
+                yield response
+            return
+
+        for _ in range(_MAX_REDIRECTS + 1):
+            conn, response = self._begin('GET', url, headers, timeout)
+            location = response.getheader('Location')
+            if response.status not in _REDIRECT_STATUSES or not location:
+                break
+            response.read()
+            url = urllib.parse.urljoin(url, location)
+
+        if not 200 <= response.status < 300:
+            response.read()
+            raise urllib.error.HTTPError(
+                url, response.status, response.reason, response.headers, None,
+            )
+
+        response.url = url
+        try:
+            yield response
+            # Drain anything the caller left (e.g. tar padding) so the
+            # connection can be reused.
+            response.read()
+        except BaseException:
+            conn.close()
             raise
-        except urllib.error.URLError as e:
-            self.logger.error(f"Network error: {e.reason}")
-            return None
 
-    def url_exists(self, url, timeout=5):
-        """Check if a URL is reachable (HEAD-like probe)."""
+    def _request(self, method, url, headers=None, timeout=30):
+        """Send a request over a reused keep-alive connection.
+
+        Follows redirects and retries 502/503/504 with exponential backoff.
+
+        Returns:
+            (status, headers, body)
+        Raises:
+            urllib.error.URLError on network failure
+        """
+        headers = dict(headers or {})
+        headers.setdefault('User-Agent', f"pget/{PGET_VERSION}")
+
+        for attempt in range(_MAX_RETRIES + 1):
+            target = url
+            status, resp_headers, body = self._send(
+                method, target, headers, timeout,
+            )
+            redirects = 0
+            while (
+                status in _REDIRECT_STATUSES and
+                resp_headers.get('Location') and
+                redirects < _MAX_REDIRECTS
+            ):
+                target = urllib.parse.urljoin(target, resp_headers['Location'])
+                redirects += 1
+                status, resp_headers, body = self._send(
+                    method, target, headers, timeout,
+                )
+            if status not in _RETRY_STATUSES or attempt == _MAX_RETRIES:
+                return status, resp_headers, body
+            time.sleep(_RETRY_BACKOFF * (2 ** attempt))
+
+    def _get_json(self, url, headers=None, timeout=30):
+        """GET a JSON URL.
+
+        Returns:
+            (status, etag, body) - body is None for 304/404 and network errors
+        """
+        # JSON compresses ~10x; list and release responses run to hundreds of KB.
+        request_headers = {
+            'Accept': 'application/vnd.github.v3+json',
+            'Accept-Encoding': 'gzip',
+        }
+        request_headers.update(headers or {})
         try:
-            req = urllib.request.Request(url)
-            urllib.request.urlopen(
-                req, timeout=timeout, context=self.ssl_context,
+            status, resp_headers, body = self._request(
+                'GET', url, request_headers, timeout,
             )
-            return True
-        except (urllib.error.HTTPError, urllib.error.URLError):
-            return False
+        except urllib.error.URLError as e:
+            self.logger.error(f"Network error: {e.reason}")
+            return None, None, None
+
+        if status in (304, 404):
+            return status, resp_headers.get('ETag'), None
+        if status >= 400:
+            raise urllib.error.HTTPError(
+                url, status, http.client.responses.get(status, ''),
+                resp_headers, None,
+            )
+        if resp_headers.get('Content-Encoding') == 'gzip':
+            body = gzip.decompress(body)
+        return status, resp_headers.get('ETag'), json.loads(body)
 
-    def _api_request(self, url):
-        """Make API request to GitHub."""
-        return self.fetch_json(url)
+    def fetch_json(self, url, timeout=30, ttl=None):
+        """Fetch a URL and return parsed JSON (None on error/404).
 
-    def _download_file(self, url, dest_path):
-        """Download file from URL."""
-        self.logger.debug(f"Downloading from {url}")
+        With a ttl, the response is served from / stored in the on-disk
+        cache (see gh_cache).
+        """
+        if ttl is not None:
+            return cached_get(
+                url,
+                lambda u, h: self._get_json(u, h, timeout=timeout),
+                ttl=ttl,
+            )
+        return self._get_json(url, timeout=timeout)[2]
 
-        try:
-            with urllib.request.urlopen(
-                url, timeout=60, context=self.ssl_context,
-            ) as response:
-                total_size = response.getheader('Content-Length')
-                if total_size:
-                    total_size = int(total_size)
-                    size_mb = total_size / (1024 * 1024)
-                    self.logger.info(f"Downloading {dest_path.name} ({size_mb:.1f} MB)")
+    def _head_status(self, url, headers=None, timeout=5):
+        """HEAD a URL.
 
-                content = response.read()
+        Returns:
+            (status, etag, exists) - a definite answer (2xx or 404) is
+            reported as status 200 so gh_cache keeps misses as well as hits;
+            exists is None for 304 and errors
+        """
+        try:
+            status, resp_headers, _ = self._request(
+                'HEAD', url, headers, timeout,
+            )
+        except urllib.error.URLError:
+            return None, None, None
+        etag = resp_headers.get('ETag')
+        if status == 304:
+            return status, etag, None
+        if 200 <= status < 300 or status == 404:
+            return 200, etag, status != 404
+        return status, None, None
+
+    def head(self, url, timeout=5, ttl=None):
+        """Check if a URL exists with a HEAD request (no body transferred).
+
+        With a ttl, the answer is cached on disk like fetch_json responses.
+        """
+        if ttl is not None:
+            return bool(cached_get(
+                url,
+                lambda u, h: self._head_status(u, h, timeout=timeout),
+                ttl=ttl,
+            ))
+        return bool(self._head_status(url, timeout=timeout)[2])
+
+    def _api_request(self, url, ttl=0):
+        """Make API request to GitHub.
+
+        Responses go through the on-disk cache (see gh_cache): served as-is
+        for ttl seconds, then revalidated with If-None-Match. The default
+        ttl=0 always revalidates, so an unchanged resource costs a 304 with
+        no body (which GitHub does not count against the rate limit).
+
+        Within one process each URL is requested at most once; misses
+        (None) are not remembered so they can be retried.
+        """
+        data = _api_memo.get(url)
+        if data is None:
+            data = cached_get(url, self._get_json, ttl=ttl)
+            if data is not None:
+                _api_memo[url] = data
+        return data
 
-                dest_path.parent.mkdir(parents=True, exist_ok=True)
-                with dest_path.open('wb') as f:
-                    f.write(content)
+    def _copy_with_progress(self, response, f, name, total_size):
+        """Stream response to f, reporting progress about every 10%.
 
-                self.logger.info(f"Downloaded {dest_path.name}")
-                return dest_path
+        Without a Content-Length, reports every PROGRESS_STEP bytes.
+        """
+        step = total_size // 10 if total_size else PROGRESS_STEP
+        step = max(step, DOWNLOAD_CHUNK_SIZE)
+        done = 0
+        next_report = step
+        while True:
+            chunk = response.read(DOWNLOAD_CHUNK_SIZE)
+            if not chunk:
+                break
+            f.write(chunk)
+            done += len(chunk)
+            if done >= next_report:
+                next_report += step
+                if total_size:
+                    self.logger.progress(
+                        "%s: %.1f / %.1f MB", name,
+                        done / (1024 * 1024), total_size / (1024 * 1024),
+                    )
+                else:
+                    self.logger.progress(
+                        "%s: %.1f MB", name, done / (1024 * 1024),
+                    )
+
+    def _download_file(self, url, dest_path, mode=None):
+        """Download file from URL, with permission bits mode if given."""
+        self.logger.debug("Downloading from %s", url)
+
+        # Stream to a .part file: memory stays flat for large assets
+        # and an interrupted download never looks complete.
+        dest_path.parent.mkdir(parents=True, exist_ok=True)
+        part_path = dest_path.with_name(dest_path.name + ".part")
+        try:
+            try:
+                self._fetch_to(url, part_path, dest_path.name, ranged=True)
+            except (_RangeNotSatisfied, http.client.HTTPException) as e:
+                self.logger.debug(
+                    "Ranged download failed (%s), retrying as one stream", e
+                )
+                self._fetch_to(url, part_path, dest_path.name, ranged=False)
+            except urllib.error.HTTPError as e:
+                # 416: e.g. an empty file, which has no byte 0 to ask for
+                if e.code != 416:
+                    raise
+                self._fetch_to(url, part_path, dest_path.name, ranged=False)
+            if mode is not None:
+                # Set before the rename: dest is then ready to hard-link
+                os.chmod(part_path, mode)
+            os.replace(part_path, dest_path)
         except urllib.error.URLError as e:
+            part_path.unlink(missing_ok=True)
             self.logger.error(f"Download failed: {e.reason}")
             return None
+        except (OSError, http.client.HTTPException) as e:
+            part_path.unlink(missing_ok=True)
+            self.logger.error(f"Download failed: {e}")
+            return None
+
+        self.logger.info(f"Downloaded {dest_path.name}")
+        return dest_path
+
+    def _fetch_to(self, url, part_path, name, ranged):
+        """Write the body of url to part_path.
+
+        With ranged=True the first request asks for the first
+        RANGE_PART_SIZE bytes only. A 206 reply carries the total size and
+        the rest is fetched in parallel by _fetch_ranges; a server that
+        ignores Range answers 200 and the whole body is streamed as before.
+        """
+        headers = {'Range': f"bytes=0-{RANGE_PART_SIZE - 1}"} if ranged else None
+        with self._open(url, headers=headers) as response:
+            partial = response.status == 206
+            total_size = _total_size(response)
+            if partial and total_size is None:
+                raise _RangeNotSatisfied("206 without a total size")
+            if total_size:
+                size_mb = total_size / (1024 * 1024)
+                self.logger.info(f"Downloading {name} ({size_mb:.1f} MB)")
+
+            with part_path.open('wb') as f:
+                if self.logger.verbose:
+                    self._copy_with_progress(response, f, name, total_size)
+                else:
+                    shutil.copyfileobj(response, f, DOWNLOAD_CHUNK_SIZE)
+            # Signed asset URLs are valid for minutes; reuse the redirect
+            # target rather than resolving it once per range.
+            final_url = response.url
+
+        if partial and total_size > RANGE_PART_SIZE:
+            self._fetch_ranges(final_url, part_path, RANGE_PART_SIZE, total_size)
+
+    def _fetch_ranges(self, url, part_path, start, total_size):
+        """Fetch bytes [start, total_size) of url into part_path, in parallel.
+
+        Each worker writes its range at the matching offset of the
+        pre-sized file over its own keep-alive connection.
+
+        Raises:
+            _RangeNotSatisfied if the server stops honouring Range
+        """
+        size = total_size - start
+        parts = min(MAX_RANGE_WORKERS, -(-size // RANGE_PART_SIZE))
+        step = -(-size // parts)
+        ranges = [
+            (first, min(first + step, total_size) - 1)
+            for first in range(start, total_size, step)
+        ]
+
+        with part_path.open('r+b') as f:
+            f.truncate(total_size)
+
+        def fetch(byte_range):
+            first, last = byte_range
+            headers = {'Range': f"bytes={first}-{last}"}
+            with self._open(url, headers=headers) as response:
+                if response.status != 206:
+                    raise _RangeNotSatisfied(
+                        f"status {response.status} for {first}-{last}"
+                    )
+                with part_path.open('r+b') as f:
+                    f.seek(first)
+                    shutil.copyfileobj(response, f, DOWNLOAD_CHUNK_SIZE)
+                    if f.tell() != last + 1:
+                        raise _RangeNotSatisfied(f"short range {first}-{last}")
+
+        with ThreadPoolExecutor(max_workers=len(ranges)) as pool:
+            # list() re-raises the first worker failure
+            list(pool.map(fetch, ranges))
+
+    def list_repos(self, ttl=None):
+        """List every repository in the organization.
+
+        Pages past the first are fetched concurrently, sized from the org's
+        public_repos count; fetching continues while pages come back full
+        in case that count lags behind.
+
+        Returns:
+            List of repo dicts, or None if the first page failed
+        """
+        url = f"{self.api_base}/orgs/{self.org}/repos?per_page={REPOS_PER_PAGE}"
+        repos = self.fetch_json(url, ttl=ttl)
+        if repos is None or len(repos) < REPOS_PER_PAGE:
+            return repos
+
+        def fetch_page(page):
+            return self.fetch_json(f"{url}&page={page}", ttl=ttl) or []
+
+        org = self.fetch_json(f"{self.api_base}/orgs/{self.org}", ttl=ttl) or {}
+        last_page = -(-org.get("public_repos", 0) // REPOS_PER_PAGE)
+        page = 1
+        last = repos
+        if last_page > 1:
+            pages = range(2, last_page + 1)
+            workers = min(MAX_PAGE_WORKERS, len(pages))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                for last in pool.map(fetch_page, pages):
+                    repos.extend(last)
+            page = last_page
+
+        while len(last) == REPOS_PER_PAGE:
+            page += 1
+            last = fetch_page(page)
+            repos.extend(last)
+
+        return repos
 
     def get_repo_info(self, app_name):
         """Get repository information."""
         url = f"{self.api_base}/repos/{self.org}/{app_name}"
-        self.logger.debug(f"Fetching repo info: {url}")
-        return self._api_request(url)
+        self.logger.debug("Fetching repo info: %s", url)
+        return self._api_request(url, ttl=DEFAULT_TTL)
+
+    def get_repo_tree(self, app_name, ref="main"):
+        """Get the top-level paths of a repository at a ref.
+
+        One Git Trees API call answers both "is there a .program marker?"
+        and "does it ship a doc/ directory?".
+
+        Returns:
+            frozenset of top-level paths, or None if the tree is unavailable
+        """
+        url = f"{self.api_base}/repos/{self.org}/{app_name}/git/trees/{ref}"
+        self.logger.debug("Fetching repo tree: %s", url)
+        try:
+            tree = self._api_request(url, ttl=DEFAULT_TTL)
+        except urllib.error.HTTPError as e:
+            # 409 for empty repositories
+            self.logger.debug("Repo tree unavailable (%s): %s", e.code, url)
+            return None
+        if not tree:
+            return None
+        return frozenset(entry.get("path") for entry in tree.get("tree", []))
 
     def get_latest_release(self, app_name):
         """Get latest release information."""
         url = f"{self.api_base}/repos/{self.org}/{app_name}/releases/latest"
-        self.logger.debug(f"Fetching latest release: {url}")
-        return self._api_request(url)
+        self.logger.debug("Fetching latest release: %s", url)
+        return self._api_request(url, ttl=RELEASE_TTL)
 
     def get_release_by_tag(self, app_name, tag):
         """Get specific release by tag.
@@ -168,7 +674,7 @@ class GitHubFetcher:
             tag = f"v{tag}"
 
         url = f"{self.api_base}/repos/{self.org}/{app_name}/releases/tags/{tag}"
-        self.logger.debug(f"Fetching release {tag}: {url}")
+        self.logger.debug("Fetching release %s: %s", tag, url)
         return self._api_request(url)
 
     def _download_release_asset(self, app_name, release, asset_name):
@@ -184,8 +690,18 @@ class GitHubFetcher:
             self.logger.error(f"Asset {asset_name} missing download URL")
             return None
 
-        cache_path = get_cache_path(app_name, asset_name)
-        result = self._download_file(download_url, cache_path)
+        download_dir = get_download_dir(app_name)
+        cache_path = download_dir / asset_name
+        if _is_cached_asset(cache_path, match):
+            self.logger.info(f"Using cached {asset_name}")
+            return cache_path
+        # Executable as downloaded, so install_file can link instead of copy
+        result = self._download_file(download_url, cache_path, 0o755)
+        if result:
+            # Keep only the newest asset per app; older releases are not reused
+            for old in download_dir.iterdir():
+                if old != cache_path and not old.name.endswith(".part"):
+                    old.unlink(missing_ok=True)
         return result
 
     def download_binary(self, app_name, platform=None, version=None):
@@ -217,8 +733,8 @@ class GitHubFetcher:
         version_tag = release.get("tag_name", "unknown")
         version_clean = str(version_tag).lstrip('v')
         self.logger.progress(
-            f"Looking for binary: {app_name}-{version_clean}-{platform} "
-            f"(or legacy {app_name}-{platform})",
+            "Looking for binary: %s-%s-%s (or legacy %s-%s)",
+            app_name, version_clean, platform, app_name, platform,
         )
         # Versioned asset first, then legacy name-platform only
         candidates = [
@@ -233,53 +749,57 @@ class GitHubFetcher:
             if cache_path:
                 break
         if not cache_path:
-            self.logger.debug(f"No binary found for {platform}")
+            self.logger.debug("No binary found for %s", platform)
             return None, version_tag
 
         return cache_path, version_tag
 
-    def download_source(self, app_name, ref="main", edge=False, version=None):
-        """Download source code archive.
-
-        Args:
-            app_name: Name of the app
-            ref: Git ref to download (default: main)
-            edge: If True, always use main branch; if False, prefer latest release
-            version: Specific version to download (e.g., "0.1.0"), overrides edge mode
-        """
-        self.logger.progress(f"Downloading source for {app_name}")
+    def _source_candidates(self, app_name, ref="main", edge=False, version=None):
+        """Yield (tarball_url, tag) to try, most preferred first."""
+        base = f"{self.api_base}/repos/{self.org}/{app_name}/tarball"
 
         # Use specific version if provided
         if version:
             tag = f"v{version}" if not version.startswith('v') else version
-            url = f"{self.api_base}/repos/{self.org}/{app_name}/tarball/{tag}"
-            cache_path = get_cache_path(app_name, f"{app_name}-{tag}.tar.gz")
-            result = self._download_file(url, cache_path)
-            if result:
-                return result, tag
-            self.logger.error(f"Failed to download source for version {version}")
-            return None, None
+            yield f"{base}/{tag}", tag
+            return
 
         # Use latest release tag if not in edge mode
         if not edge:
             release = self.get_latest_release(app_name)
             if release:
                 tag = release.get("tag_name", ref)
-                url = f"{self.api_base}/repos/{self.org}/{app_name}/tarball/{tag}"
-                cache_path = get_cache_path(app_name, f"{app_name}-{tag}.tar.gz")
-                result = self._download_file(url, cache_path)
-                if result:
-                    return result, tag
+                yield f"{base}/{tag}", tag
 
         # Fallback to main branch (or always use main in edge mode)
-        url = f"{self.api_base}/repos/{self.org}/{app_name}/tarball/{ref}"
-        cache_path = get_cache_path(app_name, f"{app_name}-{ref}.tar.gz")
+        yield f"{base}/{ref}", ref
 
-        result = self._download_file(url, cache_path)
-        if result:
-            return result, ref
+    def _extract_tarball(self, url, dest_dir):
+        """Stream a .tar.gz from url straight into dest_dir.
 
-        return None, None
+        The archive is decompressed and unpacked as it arrives ("r|gz"), so
+        it is never written to disk or read back.
+
+        Returns:
+            Name of the archive's top-level directory (GitHub tarballs hold
+            a single pynosaur-<app>-<sha>/ dir), or None on failure
+        """
+        self.logger.debug("Downloading from %s", url)
+        try:
+            with self._open(url) as response:
+                with tarfile.open(fileobj=response, mode="r|gz") as tar:
+                    first = tar.next()
+                    if first is None:
+                        self.logger.error("Extracted archive is empty")
+                        return None
+                    # extractall still sees first: it is kept in tar.members
+                    tar.extractall(path=dest_dir)
+            return first.name.split('/', 1)[0]
+        except urllib.error.URLError as e:
+            self.logger.debug("Download failed: %s", e.reason)
+        except (tarfile.TarError, EOFError, OSError) as e:
+            self.logger.error(f"Failed to extract source: {e}")
+        return None
 
     def download_app_directory(self, app_name, ref="main", edge=False, version=None):
         """Download full source tarball and extract.
@@ -290,49 +810,20 @@ class GitHubFetcher:
             edge: If True, use main branch; if False, prefer latest release
             version: Specific version to download (e.g., "0.1.0")
         """
-        (tar_path, version_tag) = self.download_source(
-            app_name,
-            ref,
-            edge=edge,
-            version=version,
-        )
-        if not tar_path:
-            return None
-
+        self.logger.progress("Downloading source for %s", app_name)
         extract_root = get_temp_cache_dir(app_name) / "src"
         extract_root.mkdir(parents=True, exist_ok=True)
 
         self.logger.info(f"Extracting source code...")
-        try:
-            with tarfile.open(tar_path, "r:gz") as tar:
-                tar.extractall(path=extract_root)
-            self.logger.info("Extraction complete")
-        except tarfile.TarError as e:
-            self.logger.error(f"Failed to extract source: {e}")
-            return None
-
-        # GitHub tarball creates top-level dir like pynosaur-yday-<hash>
-        # Pick first directory
-        children = [p for p in extract_root.iterdir() if p.is_dir()]
-        if not children:
-            self.logger.error("Extracted archive is empty")
-            return None
-
-        return children[0], version_tag
-
-    def _download_directory(self, api_url, dest_dir):
-        """Recursively download directory contents."""
-        contents = self._api_request(api_url)
-        if not contents:
-            return
-
-        dest_dir.mkdir(parents=True, exist_ok=True)
-
-        for item in contents:
-            if item["type"] == "file":
-                file_url = item["download_url"]
-                file_path = dest_dir / item["name"]
-                self._download_file(file_url, file_path)
-            elif item["type"] == "dir":
-                self._download_directory(item["url"], dest_dir / item["name"])
+        for url, tag in self._source_candidates(app_name, ref, edge, version):
+            # GitHub tarball creates top-level dir like pynosaur-yday-<hash>.
+            # Take its name from the archive: extract_root may still hold
+            # trees from earlier runs.
+            top_dir = self._extract_tarball(url, extract_root)
+            if top_dir:
+                self.logger.info("Extraction complete")
+                return extract_root / top_dir, tag
 
+        if version:
+            self.logger.error(f"Failed to download source for version {version}")
+        return None
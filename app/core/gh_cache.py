@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Author: @spacemany2k38
+# 2026-10-15
+
+"""
+On-disk cache for GitHub API responses.
+
+Entries live in ~/.pget/cache/gh/<sha1(url)>.json as
+{"url", "fetched_at", "etag", "body"}. A fresh entry is returned without
+touching the network; a stale one is revalidated with If-None-Match, and a
+304 (which does not count against the GitHub rate limit) just refreshes it.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+from ..utils.paths import PGET_CACHE
+
+GH_CACHE_DIR = PGET_CACHE / "gh"
+DEFAULT_TTL = 24 * 60 * 60
+
+
+def _entry_path(url):
+    return GH_CACHE_DIR / f"{hashlib.sha1(url.encode()).hexdigest()}.json"
+
+
+def _load(path):
+    try:
+        with path.open('r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _store(path, entry):
+    """Write an entry atomically (concurrent fetches may race on one URL)."""
+    try:
+        GH_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=str(GH_CACHE_DIR), suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(entry, f)
+            os.replace(tmp, str(path))
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    except (OSError, TypeError, ValueError):
+        # Best effort; a cache write must never fail a command
+        pass
+
+
+def cached_get(url, fetch, ttl=DEFAULT_TTL):
+    """Return the JSON body for url, from cache when possible.
+
+    Args:
+        url: Request URL (the cache key)
+        fetch: Callable fetch(url, headers) -> (status, etag, body)
+        ttl: Seconds an entry is served without revalidation
+
+    Returns:
+        Parsed JSON body, or None if the resource is unavailable
+    """
+    path = _entry_path(url)
+    entry = _load(path)
+    now = time.time()
+
+    if entry and now - entry.get('fetched_at', 0) < ttl:
+        return entry['body']
+
+    headers = {}
+    if entry and entry.get('etag'):
+        headers['If-None-Match'] = entry['etag']
+
+    status, etag, body = fetch(url, headers)
+
+    if status == 304 and entry:
+        entry['fetched_at'] = now
+        _store(path, entry)
+        return entry['body']
+
+    if status == 200:
+        _store(path, {
+            'url': url,
+            'fetched_at': now,
+            'etag': etag,
+            'body': body,
+        })
+
+    return body
+
+
+def clear():
+    """Remove all cached responses.
+
+    Returns:
+        Number of entries removed
+    """
+    if not GH_CACHE_DIR.exists():
+        return 0
+    count = sum(1 for p in GH_CACHE_DIR.glob("*.json"))
+    shutil.rmtree(GH_CACHE_DIR, ignore_errors=True)
+    return count
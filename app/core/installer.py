@@ -3,25 +3,73 @@
 # Author: @spacemany2k38
 # 2025-12-24
 
+import collections
+import functools
+import hashlib
+import os
 import platform
 import shutil
-import stat
 import subprocess
 from pathlib import Path
 from ..utils.paths import (
     get_binary_path,
     find_existing_binary,
     get_doc_dir,
+    get_doc_fingerprint_file,
     get_app_dir,
-    get_temp_cache_dir,
+    clear_temp_cache_dir,
+    PGET_CACHE,
     ensure_dirs,
     ensure_path_in_shell,
     link_to_system_bin,
     unlink_from_system_bin,
 )
 from ..core.script_installer import PGET_SCRIPTS, uninstall_script
+from ..utils.fastcopy import fast_copy, fast_rmtree, install_file
 from ..utils.logger import get_logger
-from ..utils.metadata import save_package_info, get_package_version, remove_package_info
+from ..utils.metadata import (
+    save_package_info, get_package_info, get_package_version,
+    remove_package_info,
+)
+
+# Bazel disk and repository caches, shared by every source build
+BAZEL_CACHE = PGET_CACHE / "bazel"
+
+# _sanitize_binary rewrites installed binaries in place, so they must not
+# be hard links to the download cache or Bazel output
+_SIGNS_BINARIES = platform.system() == "Darwin"
+
+
+def _tree_fingerprint(root):
+    """Digest of the (path, size, mtime) of every file under root.
+
+    Extracted tarballs carry each file's commit-time mtime, so the same
+    release yields the same fingerprint.
+    """
+    entries = []
+    for dirpath, _, filenames in os.walk(root):
+        for name in filenames:
+            path = os.path.join(dirpath, name)
+            st = os.stat(path)
+            entries.append((os.path.relpath(path, root), st.st_size, st.st_mtime_ns))
+    return hashlib.sha256(repr(sorted(entries)).encode()).hexdigest()
+
+
+@functools.lru_cache(maxsize=1)
+def find_bazel():
+    """Return the bazelisk/bazel executable path, or None (looked up once)."""
+    return shutil.which("bazelisk") or shutil.which("bazel")
+
+
+class AppState(collections.namedtuple('AppState', 'binary version info')):
+    """What is installed for one app: its binary path (None if not
+    installed), version string and metadata dict (None if missing)."""
+
+    __slots__ = ()
+
+    @property
+    def installed(self):
+        return self.binary is not None
 
 
 class Installer:
@@ -35,7 +83,7 @@ class Installer:
         """Install app documentation files to helpers/<name>/doc/."""
         doc_source = source_path / "doc"
         if not doc_source.exists() or not doc_source.is_dir():
-            self.logger.debug(f"No doc directory found for {app_name}")
+            self.logger.debug("No doc directory found for %s", app_name)
             return
 
         # Ensure helper directory exists
@@ -44,18 +92,30 @@ class Installer:
 
         doc_dest = get_doc_dir(app_name)
 
+        # Skip the copy if these exact docs are already installed
+        fingerprint = _tree_fingerprint(doc_source)
+        fingerprint_file = get_doc_fingerprint_file(app_name)
+        try:
+            if doc_dest.is_dir() and fingerprint_file.read_text() == fingerprint:
+                self.logger.debug("Documentation for %s is up to date", app_name)
+                return
+        except OSError:
+            pass
+
         # Remove old docs if they exist
+        fingerprint_file.unlink(missing_ok=True)
         if doc_dest.exists():
             shutil.rmtree(doc_dest)
 
         # Copy doc directory
-        shutil.copytree(doc_source, doc_dest)
-        self.logger.debug(f"Installed documentation for {app_name}")
+        shutil.copytree(doc_source, doc_dest, copy_function=fast_copy)
+        fingerprint_file.write_text(fingerprint)
+        self.logger.debug("Installed documentation for %s", app_name)
 
     def _sanitize_binary(self, binary_path):
         """Clear quarantine attributes and ad-hoc codesign on macOS.
         Prevents Gatekeeper from killing unsigned downloaded binaries."""
-        if platform.system() != "Darwin":
+        if not _SIGNS_BINARIES:
             return
         try:
             subprocess.run(
@@ -66,7 +126,7 @@ class Installer:
                 ["codesign", "--force", "--sign", "-", str(binary_path)],
                 capture_output=True, check=False,
             )
-            self.logger.debug(f"Signed {binary_path.name} for macOS")
+            self.logger.debug("Signed %s for macOS", binary_path.name)
         except FileNotFoundError:
             pass
 
@@ -78,13 +138,10 @@ class Installer:
         # Nuitka onefile extraction or stale wrappers (fixes broken bin stubs).
         uninstall_script(app_name)
 
-        self.logger.progress(f"Installing {app_name} to {dest}")
+        self.logger.progress("Installing %s to %s", app_name, dest)
 
-        # Copy binary to bin directory
-        shutil.copy(binary_path, dest)
-
-        # Make executable
-        dest.chmod(dest.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+        # Link or copy binary into bin directory, executable
+        install_file(binary_path, dest, 0o755, link=not _SIGNS_BINARIES)
 
         self._sanitize_binary(dest)
 
@@ -106,7 +163,7 @@ class Installer:
             )
             return False
 
-        bazel = shutil.which("bazelisk") or shutil.which("bazel")
+        bazel = find_bazel()
         if not bazel:
             self.logger.error(
                 'Bazel is required but not found. Please install Bazel (or bazelisk) '
@@ -119,17 +176,18 @@ class Installer:
         self.logger.info("This may take several minutes...")
 
         try:
-            # Clean bazel cache to ensure fresh build
-            self.logger.debug("Cleaning bazel cache for fresh build")
+            # No `bazel clean`: Bazel rebuilds whatever changed, and the
+            # shared caches let unchanged actions and external repos be
+            # reused across apps and installs. Half the cores for Bazel
+            # leaves room for the compilers it runs, which are threaded.
             subprocess.run(
-                [bazel, "clean"],
-                cwd=source_path,
-                check=False,  # Don't fail if clean fails
-                capture_output=True,
-            )
-
-            subprocess.run(
-                [bazel, "build", target],
+                [
+                    bazel, "build",
+                    f"--disk_cache={BAZEL_CACHE / 'disk'}",
+                    f"--repository_cache={BAZEL_CACHE / 'repo'}",
+                    f"--jobs={max(1, (os.cpu_count() or 2) // 2)}",
+                    target,
+                ],
                 cwd=source_path,
                 check=True,
             )
@@ -145,9 +203,8 @@ class Installer:
 
         dest = get_binary_path(app_name)
 
-        self.logger.progress(f"Installing {app_name} to {dest}")
-        shutil.copy(built_path, dest)
-        dest.chmod(dest.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+        self.logger.progress("Installing %s to %s", app_name, dest)
+        install_file(built_path, dest, 0o755, link=not _SIGNS_BINARIES)
 
         self._sanitize_binary(dest)
 
@@ -162,35 +219,64 @@ class Installer:
         link_to_system_bin(app_name)
         return True
 
-    def uninstall(self, app_name):
-        """Uninstall a package - removes binary, helper directory, and temp cache."""
+    def uninstall(self, app_name, keep_downloads=False):
+        """Uninstall a package - removes binary, helper directory, and temp cache.
+
+        keep_downloads leaves the temp cache alone, for a replacement whose
+        new version has already been downloaded there.
+        """
         binary = find_existing_binary(app_name)
         if not binary:
             self.logger.error(f"{app_name} is not installed")
             return False
 
-        self.logger.progress(f"Uninstalling {app_name}")
+        self.logger.progress("Uninstalling %s", app_name)
         binary.unlink()
         unlink_from_system_bin(app_name)
 
         # Remove entire helper directory (doc, data, config, cache, metadata)
         app_dir = get_app_dir(app_name)
         if app_dir.exists():
-            shutil.rmtree(app_dir)
-            self.logger.debug(f"Removed helper directory: {app_dir}")
+            fast_rmtree(app_dir)
+            self.logger.debug("Removed helper directory: %s", app_dir)
 
         # Remove script directory if installed as script
         uninstall_script(app_name)
 
         # Clear temp download cache to prevent stale versions
-        temp_cache = get_temp_cache_dir(app_name)
-        if temp_cache.exists():
-            shutil.rmtree(temp_cache)
-            self.logger.debug(f"Cleared download cache: {temp_cache}")
+        if not keep_downloads:
+            temp_cache = clear_temp_cache_dir(app_name)
+            if temp_cache:
+                self.logger.debug("Cleared download cache: %s", temp_cache)
 
         self.logger.success(f"{app_name} uninstalled successfully")
         return True
 
+    def load_registry(self, names):
+        """Return {app_name: version} for the installed apps among names.
+
+        Installed means found by find_existing_binary(), as for
+        is_installed(); versions are read only for those apps.
+        """
+        return {
+            name: get_package_version(name)
+            for name in names
+            if find_existing_binary(name)
+        }
+
+    def load_state(self, app_name):
+        """Return the AppState of app_name.
+
+        Looks up the binary and reads the metadata once, for callers that
+        need more than one of is_installed, get_installed_version and
+        get_package_info.
+        """
+        binary = find_existing_binary(app_name)
+        if binary is None:
+            return AppState(None, None, None)
+        info = get_package_info(app_name)
+        return AppState(binary, get_package_version(app_name, info), info)
+
     def is_installed(self, app_name):
         """Check if package is installed."""
         return find_existing_binary(app_name) is not None
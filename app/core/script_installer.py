@@ -3,17 +3,19 @@
 # Author: @spacemany2k38
 # 2025-12-27
 
+import os
 import shutil
-import stat
 from pathlib import Path
 from ..utils.paths import (
     PGET_BIN,
     get_app_dir,
     get_doc_dir,
+    get_doc_fingerprint_file,
     ensure_dirs,
     ensure_path_in_shell,
     link_to_system_bin,
 )
+from ..utils.fastcopy import fast_copy, fast_rmtree, parallel_copytree
 from ..utils.logger import get_logger
 from ..utils.metadata import save_package_info
 
@@ -22,6 +24,42 @@ from ..utils.metadata import save_package_info
 PGET_SCRIPTS = Path.home() / ".pget" / "script"
 LEGACY_SCRIPTS = Path.home() / ".pget" / "scripts"
 
+# Copied source trees leave these out (as well as bazel-* output links)
+_IGNORED_NAMES = frozenset((
+    '.git',
+    '__pycache__',
+    '.pytest_cache',
+    '.mypy_cache',
+    'node_modules',
+))
+
+
+def _ignore(dir, files):
+    """Skip bazel artifacts, git, cache, and other build artifacts."""
+    return [
+        f for f in files
+        if f in _IGNORED_NAMES or f.startswith('bazel-')
+    ]
+
+
+# Executable written to ~/.pget/bin/<app> for a script install
+_WRAPPER_TEMPLATE = b"""#!/usr/bin/env python3
+import sys
+from pathlib import Path
+_root = Path.home() / ".pget" / "script" / "%(app_name)b"
+if not (_root / "app" / "main.py").exists():
+    print(
+        "pget: %(app_name)b script install is missing or broken "
+        "(expected source under ~/.pget/script/%(app_name)b/). "
+        "Try: pget install %(app_name)b",
+        file=sys.stderr,
+    )
+    sys.exit(1)
+sys.path.insert(0, str(_root))
+from app.main import main
+sys.exit(main())
+"""
+
 
 def ensure_script_dir():
     """Ensure script directory exists; migrate legacy if needed."""
@@ -57,64 +95,37 @@ def install_as_script(source_path, app_name, version, source_url):
     script_dir = PGET_SCRIPTS / app_name
 
     # If source and destination are the same path (e.g. pget self-update from a script
-    # install), make a temp copy first so rmtree doesn't delete the source.
+    # install), move the source aside first so rmtree doesn't delete it. The temp dir
+    # sits next to the scripts dir, so this is a rename rather than a copy.
     import tempfile as _tempfile
     _temp_dir = None
     if source_path.resolve() == script_dir.resolve():
-        _temp_dir = Path(_tempfile.mkdtemp())
+        _temp_dir = Path(_tempfile.mkdtemp(prefix=".script-", dir=PGET_SCRIPTS.parent))
         _temp_source = _temp_dir / app_name
-        shutil.copytree(source_path, _temp_source, symlinks=False)
+        source_path.rename(_temp_source)
         source_path = _temp_source
 
     if script_dir.exists():
         shutil.rmtree(script_dir)
 
-    def ignore_patterns(dir, files):
-        """Skip bazel artifacts, git, cache, and other build artifacts."""
-        ignore = []
-        for f in files:
-            if (
-                f.startswith('bazel-') or
-                f in (
-                    '.git',
-                    '__pycache__',
-                    '.pytest_cache',
-                    '.mypy_cache',
-                    'node_modules',
-                )
-            ):
-                ignore.append(f)
-        return ignore
-
-    shutil.copytree(source_path, script_dir, ignore=ignore_patterns, symlinks=False)
+    parallel_copytree(source_path, script_dir, _ignore)
     if _temp_dir and _temp_dir.exists():
         shutil.rmtree(_temp_dir, ignore_errors=True)
         source_path = script_dir  # point to installed copy for doc install below
-    logger.debug(f"Copied source to {script_dir}")
+    logger.debug("Copied source to %s", script_dir)
 
     # Create executable wrapper in bin
     wrapper_path = PGET_BIN / app_name
-    wrapper_content = """#!/usr/bin/env python3
-import sys
-from pathlib import Path
-_root = Path.home() / ".pget" / "script" / "{app_name}"
-if not (_root / "app" / "main.py").exists():
-    print(
-        "pget: {app_name} script install is missing or broken "
-        "(expected source under ~/.pget/script/{app_name}/). "
-        "Try: pget install {app_name}",
-        file=sys.stderr,
-    )
-    sys.exit(1)
-sys.path.insert(0, str(_root))
-from app.main import main
-sys.exit(main())
-""".format(app_name=app_name)
-    wrapper_path.write_text(wrapper_content)
-    wrapper_path.chmod(
-        wrapper_path.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH,
-    )
-    logger.debug(f"Created executable: {wrapper_path}")
+    wrapper_content = _WRAPPER_TEMPLATE % {b'app_name': app_name.encode()}
+    fd = os.open(wrapper_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o755)
+    try:
+        # The create mode is masked by the umask and ignored for an
+        # existing wrapper
+        os.fchmod(fd, 0o755)
+        os.write(fd, wrapper_content)
+    finally:
+        os.close(fd)
+    logger.debug("Created executable: %s", wrapper_path)
 
     # Install documentation to helpers
     doc_source = source_path / "doc"
@@ -122,10 +133,12 @@ sys.exit(main())
         app_dir = get_app_dir(app_name)
         app_dir.mkdir(parents=True, exist_ok=True)
         doc_dest = get_doc_dir(app_name)
+        # Invalidate the fingerprint Installer.install_doc_files checks
+        get_doc_fingerprint_file(app_name).unlink(missing_ok=True)
         if doc_dest.exists():
             shutil.rmtree(doc_dest)
-        shutil.copytree(doc_source, doc_dest)
-        logger.debug(f"Installed documentation for {app_name}")
+        shutil.copytree(doc_source, doc_dest, copy_function=fast_copy)
+        logger.debug("Installed documentation for %s", app_name)
 
     # Save metadata
     save_package_info(app_name, version, source_url, "script")
@@ -154,8 +167,8 @@ def uninstall_script(app_name):
     legacy_dir = LEGACY_SCRIPTS / app_name
     for sd in (script_dir, legacy_dir):
         if sd.exists():
-            shutil.rmtree(sd)
-            logger.debug(f"Removed script: {sd}")
+            fast_rmtree(sd)
+            logger.debug("Removed script: %s", sd)
 
     return True
 
@@ -3,8 +3,8 @@
 # Author: @spacemany2k38
 # 2025-12-24
 
+import importlib
 import sys
-import traceback
 from pathlib import Path
 
 # Allow running both as module (`python -m app.main`) and as script (`python
@@ -13,27 +13,43 @@ if __name__ == "__main__" and __package__ is None:
     sys.path.append(str(Path(__file__).resolve().parent.parent))
     __package__ = "app"
 
-from app.commands import install, remove, update, search, versions, downgrade
-from app.commands import list as list_cmd
 from app.utils.logger import get_logger, set_verbose
 from app.utils.paths import PGET_BIN
-from app.utils.doc_reader import read_app_doc, get_field, get_list_field
 from app import __version__
 
 
+# Command name -> module under app.commands. Modules are imported only when
+# their command runs, so --help/--version don't pay for the network and
+# install machinery.
 COMMANDS = {
-    'install': install.run,
-    'remove': remove.run,
-    'list': list_cmd.run,
-    'update': update.run,
-    'downgrade': downgrade.run,
-    'search': search.run,
-    'versions': versions.run,
+    'install': 'install',
+    'remove': 'remove',
+    'list': 'list',
+    'update': 'update',
+    'downgrade': 'downgrade',
+    'search': 'search',
+    'versions': 'versions',
+    'cache': 'cache',
 }
 
+# Options accepted anywhere on the command line
+GLOBAL_FLAGS = frozenset((
+    '--verbose', '--edge', '--script', '--build', '--no-verify-ssl',
+))
+# Global options handed back to the commands that use them
+PASSTHROUGH_FLAGS = ('--edge', '--script', '--build', '--no-verify-ssl')
+PASSTHROUGH_COMMANDS = frozenset(('install', 'update', 'downgrade'))
+
+
+def _load_command(module):
+    """Import a command module and return its run() function."""
+    return importlib.import_module(f"app.commands.{module}").run
+
 
 def print_help():
     """Print help message from documentation."""
+    from app.utils.doc_reader import read_app_doc, get_field, get_list_field
+
     doc = read_app_doc("pget")
 
     if not doc:
@@ -76,6 +92,8 @@ def _print_section(title, items):
 
 def print_version():
     """Print version information from documentation."""
+    from app.utils.doc_reader import read_app_doc, get_field
+
     doc = read_app_doc("pget")
     version = get_field(doc, 'VERSION', __version__)
     name = get_field(doc, 'NAME', 'pget')
@@ -100,34 +118,18 @@ def main():
         print_version()
         return 0
 
-    # Check for verbose flag
-    if '--verbose' in args:
+    # Pull global flags out of args in one pass
+    flags = set()
+    rest = []
+    for a in args:
+        if a in GLOBAL_FLAGS:
+            flags.add(a)
+        else:
+            rest.append(a)
+    args = rest
+
+    if '--verbose' in flags:
         set_verbose(True)
-        args = [a for a in args if a != '--verbose']
-
-    # Check for edge flag globally (pass through to install command)
-    edge_mode = False
-    if '--edge' in args:
-        edge_mode = True
-        args = [a for a in args if a != '--edge']
-
-    # Check for script flag globally (pass through to install command)
-    script_mode = False
-    if '--script' in args:
-        script_mode = True
-        args = [a for a in args if a != '--script']
-
-    # Check for build flag globally (pass through to install command)
-    build_mode = False
-    if '--build' in args:
-        build_mode = True
-        args = [a for a in args if a != '--build']
-
-    # Check for no-verify-ssl flag globally (pass through to install/update command)
-    no_verify_ssl = False
-    if '--no-verify-ssl' in args:
-        no_verify_ssl = True
-        args = [a for a in args if a != '--no-verify-ssl']
 
     # Get command
     if not args:
@@ -138,37 +140,32 @@ def main():
     command_args = args[1:]
 
     # Re-add command-specific flags to command_args if they were present
-    if command in ('install', 'update', 'downgrade'):
-        if edge_mode:
-            command_args = ['--edge'] + command_args
-        if script_mode:
-            command_args = ['--script'] + command_args
-        if build_mode:
-            command_args = ['--build'] + command_args
-        if no_verify_ssl:
-            command_args = ['--no-verify-ssl'] + command_args
+    if command in PASSTHROUGH_COMMANDS:
+        command_args = [f for f in PASSTHROUGH_FLAGS if f in flags] + command_args
 
     # Execute command
-    if command in COMMANDS:
-        try:
-            success = COMMANDS[command](command_args)
-            return 0 if success else 1
-        except KeyboardInterrupt:
-            logger = get_logger()
-            logger.warning("Operation cancelled")
-            return 130
-        except Exception as e:
-            logger = get_logger()
-            logger.error(f"Unexpected error: {e}")
-            if get_logger().verbose:
-                traceback.print_exc()
-            return 1
-    else:
+    module = COMMANDS.get(command)
+    if module is None:
         logger = get_logger()
         logger.error(f"Unknown command: {command}")
         logger.info(f"Did you mean: pget install {command}?")
         return 1
 
+    try:
+        success = _load_command(module)(command_args)
+        return 0 if success else 1
+    except KeyboardInterrupt:
+        logger = get_logger()
+        logger.warning("Operation cancelled")
+        return 130
+    except Exception as e:
+        logger = get_logger()
+        logger.error(f"Unexpected error: {e}")
+        if get_logger().verbose:
+            import traceback
+            traceback.print_exc()
+        return 1
+
 
 if __name__ == "__main__":
     sys.exit(main())
@@ -4,28 +4,42 @@
 
 import hashlib
 import json
-import re
 from pathlib import Path
 
 from ..utils.logger import get_logger
 from .pgp import PGPError, verify_detached_signature
 
-SHA256_RE = re.compile(r"^[a-f0-9]{64}$")
+# A sha256 entry is 64 lowercase hex digits
+_HEX_DIGITS = frozenset("0123456789abcdef")
 
 
 class ManifestError(RuntimeError):
     """Raised when manifest validation fails."""
 
 
+# Read buffer for hashing on Pythons without hashlib.file_digest
+HASH_BUFSIZE = 4 * 1024 * 1024
+
+
 def sha256_file(path: Path) -> str:
     """Compute SHA256 for a file."""
-    h = hashlib.sha256()
-    with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(1024 * 1024), b""):
-            h.update(chunk)
+    with path.open("rb", buffering=0) as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        h = hashlib.sha256()
+        buf = memoryview(bytearray(HASH_BUFSIZE))
+        while True:
+            n = f.readinto(buf)
+            if not n:
+                break
+            h.update(buf[:n])
     return h.hexdigest()
 
 
+def _is_sha256(digest) -> bool:
+    return isinstance(digest, str) and len(digest) == 64 and set(digest) <= _HEX_DIGITS
+
+
 def _validate_manifest_schema(manifest: dict):
     if not isinstance(manifest, dict):
         raise ManifestError("Manifest is not an object")
@@ -37,7 +51,7 @@ def _validate_manifest_schema(manifest: dict):
     for name, digest in assets.items():
         if not isinstance(name, str):
             raise ManifestError("Manifest asset name is not a string")
-        if not isinstance(digest, str) or not SHA256_RE.match(digest):
+        if not _is_sha256(digest):
             raise ManifestError(f"Manifest asset '{name}' has invalid sha256")
 
 
@@ -53,7 +67,7 @@ def verify_manifest(manifest_path: Path, signature_path: Path):
     fingerprint = verify_detached_signature(manifest_path, signature_path)
 
     try:
-        manifest = json.loads(manifest_path.read_text())
+        manifest = json.loads(manifest_path.read_bytes())
     except Exception as exc:
         raise ManifestError(f"Failed to parse manifest: {exc}") from exc
 
@@ -81,5 +95,5 @@ def ensure_asset_checksum(manifest: dict, asset_name: str, file_path: Path):
         )
         raise ManifestError(f"Checksum mismatch for {asset_name}")
 
-    logger.debug(f"Checksum verified for {asset_name} ({actual})")
+    logger.debug("Checksum verified for %s (%s)", asset_name, actual)
 
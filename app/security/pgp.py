@@ -8,14 +8,19 @@ with pget. Verification is done in an isolated keyring built at runtime from
 those pinned keys, so the user's default keyring is never touched.
 """
 
+import hashlib
+import os
 import shutil
 import subprocess
 import tempfile
 from pathlib import Path
 
 from ..utils.logger import get_logger
+from ..utils.paths import PGET_CACHE
 
 TRUSTED_KEYS_DIR = Path(__file__).parent / "keys"
+# Keyrings built from the trusted keys, named by a digest of the key files
+GPG_CACHE_DIR = PGET_CACHE / "gpg"
 
 
 class PGPError(RuntimeError):
@@ -41,6 +46,49 @@ def _load_trusted_keys():
     return keys
 
 
+def _trusted_keyring(gpg, keys):
+    """Return an isolated keyring holding exactly the trusted keys.
+
+    The keyring is built once and reused; it is named by a digest of the
+    key files, so changing the bundled keys builds a new one. It is built
+    under a temporary name and renamed into place, so a concurrent run
+    never sees it half-imported.
+    """
+    digest = hashlib.sha256(
+        b"".join(key_file.read_bytes() for key_file in sorted(keys)),
+    ).hexdigest()[:16]
+    keyring = GPG_CACHE_DIR / f"trusted-{digest}.kbx"
+    if keyring.exists():
+        return keyring
+
+    GPG_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryDirectory(prefix="pget-gpg-", dir=GPG_CACHE_DIR) as temp_dir:
+        partial = Path(temp_dir) / "trusted.kbx"
+
+        # Import trusted keys into isolated keyring (one gpg run for all)
+        try:
+            subprocess.run(
+                [
+                    gpg,
+                    "--batch",
+                    "--no-tty",
+                    "--no-default-keyring",
+                    "--keyring",
+                    str(partial),
+                    "--import",
+                    *(str(key_file) for key_file in keys),
+                ],
+                check=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+        except subprocess.CalledProcessError as exc:
+            names = ", ".join(key_file.name for key_file in keys)
+            raise PGPError(f'Failed to import trusted keys ({names}): {exc}') from exc
+        os.replace(partial, keyring)
+    return keyring
+
+
 def verify_detached_signature(data_path: Path, signature_path: Path):
     """
     Verify a detached signature using the bundled trusted keys.
@@ -52,70 +100,51 @@ def verify_detached_signature(data_path: Path, signature_path: Path):
     """
     logger = get_logger()
     gpg = _require_gpg()
-    keys = _load_trusted_keys()
-
-    with tempfile.TemporaryDirectory(prefix="pget-gpg-") as temp_dir:
-        keyring = Path(temp_dir) / "trusted.gpg"
-
-        # Import trusted keys into isolated keyring
-        for key_file in keys:
-            try:
-                subprocess.run(
-                    [
-                        gpg,
-                        "--batch",
-                        "--no-tty",
-                        "--no-default-keyring",
-                        "--keyring",
-                        str(keyring),
-                        "--import",
-                        str(key_file),
-                    ],
-                    check=True,
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL,
-                )
-            except subprocess.CalledProcessError as exc:
-                raise PGPError(
-                    f'Failed to import trusted key {key_file.name}: {exc}',
-                ) from exc
-
-        # Verify signature; capture status lines for fingerprint extraction
-        proc = subprocess.run(
-            [
-                gpg,
-                "--batch",
-                "--no-tty",
-                "--status-fd",
-                "1",
-                "--no-default-keyring",
-                "--keyring",
-                str(keyring),
-                "--verify",
-                str(signature_path),
-                str(data_path),
-            ],
-            text=True,
-            capture_output=True,
-        )
-
-        status_output = proc.stdout or ""
-        if proc.returncode != 0:
-            logger.debug(f"gpg verify stderr: {proc.stderr}")
-            raise PGPError("Signature verification failed (gpg returned non-zero)")
-
-        # Extract fingerprint from VALIDSIG line
-        fingerprint = None
-        for line in status_output.splitlines():
+    keyring = _trusted_keyring(gpg, _load_trusted_keys())
+
+    # Verify signature; status lines go to stdout for fingerprint
+    # extraction. stderr is merged in so a single pipe is read (two pipes
+    # read one after the other can deadlock) and kept for the debug log.
+    proc = subprocess.Popen(
+        [
+            gpg,
+            "--batch",
+            "--no-tty",
+            "--status-fd",
+            "1",
+            "--no-default-keyring",
+            "--keyring",
+            str(keyring),
+            "--verify",
+            str(signature_path),
+            str(data_path),
+        ],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+    )
+
+    fingerprint = None
+    messages = []
+    with proc:
+        for line in proc.stdout:
+            if fingerprint:
+                # Drain the rest so gpg can exit
+                continue
             # Example: [GNUPG:] VALIDSIG <fingerprint> <other fields>
             if line.startswith("[GNUPG:] VALIDSIG "):
                 parts = line.split()
                 if len(parts) >= 3:
                     fingerprint = parts[2]
-                    break
+            elif not line.startswith("[GNUPG:] "):
+                messages.append(line)
 
-        if not fingerprint:
-            raise PGPError("Signature verified but fingerprint could not be determined")
+    if proc.returncode != 0:
+        logger.debug("gpg verify stderr: %s", ''.join(messages))
+        raise PGPError("Signature verification failed (gpg returned non-zero)")
 
-        return fingerprint
+    if not fingerprint:
+        raise PGPError("Signature verified but fingerprint could not be determined")
 
+    return fingerprint
@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Author: @spacemany2k38
+# 2026-10-15
+
+
+def parse_names(values):
+    """Split app name arguments on commas.
+
+    Accepts both "a,b" and separate args; blank parts are dropped.
+
+    Returns:
+        List of app names in the order given
+    """
+    return [
+        name
+        for value in values
+        for name in map(str.strip, value.split(","))
+        if name
+    ]
@@ -8,10 +8,32 @@ Lightweight YAML parser for pget app documentation.
 No external dependencies - uses only Python standard library.
 """
 
-import re
+import os
+import string
 import sys
 from pathlib import Path
 
+from .filecache import FileCache
+
+# Parsed docs by path; read_app_doc runs on every --help/--version
+_DOC_CACHE = FileCache()
+# App name -> its doc files in _DOC_DIRS order; built on first use
+_DOC_INDEX = None
+
+# Directories searched by read_app_doc, most likely first
+_DOC_DIRS = (
+    # Nuitka onefile bundles files in a temp directory
+    *((os.path.join(sys._MEIPASS, "doc"),) if hasattr(sys, '_MEIPASS') else ()),
+    str(Path(__file__).parent.parent.parent / "doc"),  # Source repo
+    "doc",  # Relative (bundled)
+)
+
+# parse_yaml states: after a single value, in a list, in multiline text
+_SCALAR, _LIST, _TEXT = range(3)
+
+# Characters of a top-level key; "KEY: value" starts at column 0
+_KEY_CHARS = string.ascii_uppercase + '_'
+
 
 def read_app_doc(app_name):
     """Read app documentation from bundled YAML file.
@@ -24,23 +46,41 @@ def read_app_doc(app_name):
     Returns:
         dict: Parsed YAML with ALL CAPS keys, or {} if not found
     """
-    search_paths = [
-        Path(__file__).parent.parent.parent / "doc" / f"{app_name}.yaml",  # Source repo
-        Path("doc") / f"{app_name}.yaml",  # Relative (bundled)
-    ]
+    for path in _doc_index().get(app_name, ()):
+        try:
+            return _DOC_CACHE.get(path, _load_doc)
+        except (OSError, UnicodeDecodeError):
+            continue
 
-    # Nuitka onefile bundles files in a temp directory
-    if hasattr(sys, '_MEIPASS'):
-        search_paths.insert(0, Path(sys._MEIPASS) / "doc" / f"{app_name}.yaml")
+    return {}
 
-    for path in search_paths:
-        if path.exists():
+
+def invalidate():
+    """Rescan the doc directories on the next read_app_doc call."""
+    global _DOC_INDEX
+    _DOC_INDEX = None
+
+
+def _doc_index():
+    """List every doc directory once instead of probing per app."""
+    global _DOC_INDEX
+    if _DOC_INDEX is None:
+        index = {}
+        for doc_dir in _DOC_DIRS:
             try:
-                return parse_yaml(path.read_text())
-            except (OSError, UnicodeDecodeError):
+                with os.scandir(doc_dir) as entries:
+                    for entry in entries:
+                        if entry.name.endswith('.yaml'):
+                            index.setdefault(entry.name[:-5], []).append(entry.path)
+            except OSError:
                 continue
+        _DOC_INDEX = index
+    return _DOC_INDEX
 
-    return {}
+
+def _load_doc(path):
+    with open(path, encoding='utf-8') as f:
+        return parse_yaml(f.read())
 
 
 def parse_yaml(content):
@@ -60,71 +100,57 @@ def parse_yaml(content):
         dict: Parsed YAML with original list structures preserved
     """
     doc = {}
-    current_key = None
-    current_list = None
-    multiline_text = None
+    state = _SCALAR
+    key = None
+    text = None
 
-    for line in content.split('\n'):
+    for line in content.splitlines():
         stripped = line.strip()
 
         # Skip empty lines and comments
-        if not stripped or stripped.startswith('#'):
+        if not stripped or stripped[0] == '#':
             continue
 
-        # Match KEY: value pattern
-        key_match = re.match(r'^([A-Z_]+):\s*(.*)$', line)
-        if key_match:
-            # Save previous key
-            _save_current(doc, current_key, current_list, multiline_text)
+        # Match KEY: value pattern; strip() leaves nothing of a key made
+        # only of _KEY_CHARS
+        head, colon, tail = line.partition(':')
+        if colon and head and not head.strip(_KEY_CHARS):
+            # Save previous multiline value (lists are filled in place)
+            if state == _TEXT:
+                doc[key] = ' '.join(text)
 
-            current_key = key_match.group(1)
-            value = key_match.group(2).strip()
+            key = head
+            value = tail.strip()
 
             if value == '>':
                 # Multiline string mode
-                multiline_text = []
-                current_list = None
+                state = _TEXT
+                text = []
             elif value:
                 # Single value
-                doc[current_key] = value.strip('"').strip("'")
-                current_key = None
-                current_list = None
-                multiline_text = None
+                state = _SCALAR
+                doc[key] = value.strip('"').strip("'")
             else:
                 # List mode (values on next lines)
-                current_list = []
-                multiline_text = None
+                state = _LIST
+                items = doc[key] = []
 
-        # Match list item (- value)
-        elif stripped.startswith('-') and current_key:
-            if current_list is None:
-                current_list = []
-            item = stripped[1:].strip().strip('"').strip("'")
-            current_list.append(item)
+        # Match list item (- value); dropped inside multiline text
+        elif stripped[0] == '-':
+            if state == _LIST:
+                items.append(stripped[1:].strip().strip('"').strip("'"))
 
         # Multiline continuation (indented text)
-        elif multiline_text is not None and line.startswith('  '):
-            multiline_text.append(stripped)
+        elif state == _TEXT and line.startswith('  '):
+            text.append(stripped)
 
-    # Save final key
-    _save_current(doc, current_key, current_list, multiline_text)
+    # Save final multiline value
+    if state == _TEXT:
+        doc[key] = ' '.join(text)
 
     return doc
 
 
-def _save_current(doc, key, list_val, multiline_val):
-    """Helper to save current key-value pair."""
-    if key is None:
-        return
-
-    if multiline_val is not None:
-        doc[key] = ' '.join(multiline_val)
-    elif list_val is not None:
-        doc[key] = list_val
-    elif key not in doc:
-        doc[key] = ''
-
-
 def get_field(doc, field, default=''):
     """Safely get field from doc with default."""
     return doc.get(field, default)
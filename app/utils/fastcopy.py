@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Author: @spacemany2k38
+# 2026-10-15
+
+import errno
+import os
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# ioctl sharing src's extents with dst (reflink) on btrfs/xfs/bcachefs
+FICLONE = 0x40049409
+
+# Bytes requested per copy_file_range/sendfile call; the kernel copies
+# what it can.
+COPY_CHUNK = 1 << 30
+# Buffer for the userspace copy when neither is available
+COPY_BUFSIZE = 1 << 20
+# Files copied at once by parallel_copytree; copies release the GIL and
+# keep several requests queued on the disk.
+MAX_COPY_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# The kernel refusing this pair of files (old kernel, filesystem or file
+# type without support, sendfile to a non-socket on macOS): fall back to
+# the next method.
+_FALLBACK_ERRNOS = frozenset(
+    getattr(errno, name)
+    for name in (
+        'EXDEV', 'ENOSYS', 'EINVAL', 'EOPNOTSUPP', 'ENOTSUP', 'EPERM',
+        'ENOTSOCK',
+    )
+    if hasattr(errno, name)
+)
+
+
+def _clone(src_fd, dst_fd):
+    """Make dst_fd a copy-on-write clone of src_fd; False if unsupported."""
+    if fcntl is None or not hasattr(os, 'copy_file_range'):  # Linux only
+        return False
+    try:
+        fcntl.ioctl(dst_fd, FICLONE, src_fd)
+    except OSError:
+        return False
+    return True
+
+
+def _copy_file_range(src_fd, dst_fd):
+    """Copy src_fd to dst_fd in the kernel.
+
+    Returns:
+        False if copy_file_range is unavailable here; the file offsets
+        are left where the kernel stopped, so a later method can carry
+        on from there
+    """
+    if not hasattr(os, 'copy_file_range'):
+        return False
+    try:
+        while os.copy_file_range(src_fd, dst_fd, COPY_CHUNK):
+            pass
+    except OSError as e:
+        if e.errno not in _FALLBACK_ERRNOS:
+            raise
+        return False
+    return True
+
+
+def _sendfile(src_fd, dst_fd):
+    """Copy src_fd to dst_fd with sendfile (older Linux kernels).
+
+    Returns:
+        False if sendfile cannot write to dst_fd; as with
+        _copy_file_range, both offsets then mark how far it got
+    """
+    if not hasattr(os, 'sendfile'):
+        return False
+    offset = os.lseek(src_fd, 0, os.SEEK_CUR)
+    try:
+        while True:
+            sent = os.sendfile(dst_fd, src_fd, offset, COPY_CHUNK)
+            if not sent:
+                break
+            offset += sent
+    except OSError as e:
+        if e.errno not in _FALLBACK_ERRNOS:
+            raise
+        return False
+    finally:
+        # sendfile with an explicit offset leaves src_fd's own offset alone
+        os.lseek(src_fd, offset, os.SEEK_SET)
+    return True
+
+
+def _copy_buffered(fsrc, fdst):
+    """Copy fsrc to fdst through one reused buffer."""
+    buf = memoryview(bytearray(COPY_BUFSIZE))
+    while True:
+        n = fsrc.readinto(buf)
+        if not n:
+            break
+        fdst.write(buf[:n])
+
+
+def fast_copy(src, dst, mode=None):
+    """Copy the contents and permission bits of file src to dst.
+
+    Usable as a shutil.copytree copy_function. Unlike shutil.copy2 it
+    skips timestamps and extended attributes (several syscalls per file).
+    On CoW filesystems dst shares src's blocks (reflink); otherwise the
+    data is moved by copy_file_range, else sendfile, so it never passes
+    through Python; elsewhere a 1 MiB buffer is reused for the whole file.
+
+    Args:
+        mode: Exact permission bits for dst, set on the open file rather
+            than by a later chmod; defaults to src's, less the umask
+
+    Returns:
+        dst
+    """
+    with open(src, 'rb', buffering=0) as fsrc:
+        if mode is None:
+            create_mode = os.fstat(fsrc.fileno()).st_mode & 0o777
+        else:
+            create_mode = mode
+        fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, create_mode)
+        with open(fd, 'wb') as fdst:
+            if mode is not None:
+                os.fchmod(fd, mode)
+            if not (
+                _clone(fsrc.fileno(), fd) or
+                _copy_file_range(fsrc.fileno(), fd) or
+                _sendfile(fsrc.fileno(), fd)
+            ):
+                _copy_buffered(fsrc, fdst)
+    return dst
+
+
+def install_file(src, dst, mode=0o755, link=True):
+    """Atomically replace dst with the contents of file src.
+
+    dst is first prepared under a temporary name in its own directory,
+    then renamed over dst. A running program at dst is never written to
+    in place.
+
+    The temporary is a hard link to src (no data copied) when link is
+    true, src already has permission bits mode and both are on one
+    filesystem; otherwise it is a fast_copy with mode. A hard link shares
+    the inode, so pass link=False if dst will be modified after install,
+    and only link sources nothing rewrites in place. Release downloads
+    land via rename with mode 0o755 and are linked; read-only Bazel
+    outputs (0o555) are copied.
+    """
+    dst = Path(dst)
+    tmp = dst.with_name(f".{dst.name}.tmp")
+    tmp.unlink(missing_ok=True)
+    linked = False
+    if link and os.stat(src).st_mode & 0o7777 == mode:
+        try:
+            os.link(src, tmp)
+            linked = True
+        except OSError:
+            pass
+    if not linked:
+        fast_copy(src, tmp, mode)
+    try:
+        os.replace(tmp, dst)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+        raise
+    return dst
+
+
+def parallel_copytree(src, dst, ignore=None, workers=MAX_COPY_WORKERS):
+    """Copy the directory tree src to dst, copying files on a thread pool.
+
+    Behaves like shutil.copytree(src, dst, ignore=ignore,
+    copy_function=fast_copy) with symlinks followed: dst must not exist,
+    and ignore(dir, names) returns the names to skip in each directory.
+    Files start copying while the rest of the tree is still being walked.
+
+    Returns:
+        dst
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        copies = []
+        stack = [(os.fspath(src), os.fspath(dst))]
+        while stack:
+            src_dir, dst_dir = stack.pop()
+            os.makedirs(dst_dir)
+            with os.scandir(src_dir) as it:
+                entries = list(it)
+            skip = set(ignore(src_dir, [e.name for e in entries])) if ignore else ()
+            for entry in entries:
+                if entry.name in skip:
+                    continue
+                target = os.path.join(dst_dir, entry.name)
+                if entry.is_dir():
+                    stack.append((entry.path, target))
+                else:
+                    copies.append(pool.submit(fast_copy, entry.path, target))
+        # Re-raise the first failed copy
+        for future in copies:
+            future.result()
+    return dst
+
+
+def fast_rmtree(path):
+    """Delete the directory tree at path, like shutil.rmtree.
+
+    On POSIX the tree is removed by one `rm -rf` process, whose C walk
+    beats a Python-level lstat+unlink per entry on large source and doc
+    trees. If rm is missing or fails, shutil.rmtree runs instead (and
+    raises as usual for what is left).
+    """
+    import shutil
+    import subprocess
+
+    rm = shutil.which('rm') if os.name == 'posix' else None
+    if rm:
+        try:
+            result = subprocess.run(
+                [rm, '-rf', '--', os.fspath(path)],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+        except OSError:
+            pass
+        else:
+            if result.returncode == 0 and not os.path.lexists(path):
+                return
+    shutil.rmtree(path)
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Author: @spacemany2k38
+# 2026-10-15
+
+import os
+from collections import OrderedDict
+
+
+class FileCache:
+    """Parsed contents of files, reloaded only when a file changes.
+
+    An entry is reused while the file's (st_ino, st_mtime_ns, st_size) is
+    unchanged, so a hit costs one stat instead of a read and a parse. The
+    inode catches a file replaced by rename within one mtime tick.
+    Values are shared between callers and must not be modified.
+    """
+
+    __slots__ = ('_entries', '_maxsize')
+
+    def __init__(self, maxsize=256):
+        self._entries = OrderedDict()
+        self._maxsize = maxsize
+
+    def get(self, path, load):
+        """Return load(path), or the cached result for the file as it is.
+
+        Raises:
+            OSError from stat, e.g. FileNotFoundError if path is missing
+        """
+        path = os.fspath(path)
+        st = os.stat(path)
+        signature = (st.st_ino, st.st_mtime_ns, st.st_size)
+        entry = self._entries.get(path)
+        if entry is not None and entry[0] == signature:
+            self._entries.move_to_end(path)
+            return entry[1]
+
+        value = load(path)
+        self._entries[path] = (signature, value)
+        self._entries.move_to_end(path)
+        if len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+        return value
+
+    def discard(self, path):
+        """Forget the entry for path, if any."""
+        self._entries.pop(os.fspath(path), None)
+
+    def clear(self):
+        """Forget all entries."""
+        self._entries.clear()
@@ -6,35 +6,70 @@
 import sys
 
 
+def _noop(message, *args):
+    """Quiet debug/progress: drop the message unformatted."""
+
+
 class Logger:
-    """Simple logger for pget."""
+    """Simple logger for pget.
 
-    def __init__(self, verbose=False):
-        self.verbose = verbose
+    Messages may take printf-style arguments, e.g.
+    ``logger.info("Installing %s", name)``; they are only formatted when the
+    message is actually printed. Each message is written with one
+    stream write; sys.stdout/sys.stderr are looked up per call so
+    redirection keeps working.
+    """
 
-    def info(self, message):
-        """Print info message."""
-        print(f"[INFO] {message}")
+    # debug/progress are per-instance: bound methods when verbose, _noop
+    # otherwise, so a quiet call does no attribute check or branch
+    __slots__ = ('_verbose', 'debug', 'progress')
 
-    def success(self, message):
-        """Print success message."""
-        print(f"[OK] {message}")
+    def __init__(self, verbose=False):
+        self.verbose = verbose
 
-    def error(self, message):
-        print(f"\033[31m[ERROR] {message}\033[0m", file=sys.stderr)
+    @property
+    def verbose(self):
+        return self._verbose
 
-    def warning(self, message):
-        print(f"\033[33m[WARN] {message}\033[0m")
+    @verbose.setter
+    def verbose(self, verbose):
+        self._verbose = verbose
+        self.debug = self._debug if verbose else _noop
+        self.progress = self._progress if verbose else _noop
 
-    def debug(self, message):
-        """Print debug message (only in verbose mode)."""
-        if self.verbose:
-            print(f"[DEBUG] {message}")
+    def info(self, message, *args):
+        """Print info message."""
+        if args:
+            message = message % args
+        sys.stdout.write(f"[INFO] {message}\n")
 
-    def progress(self, message):
+    def success(self, message, *args):
+        """Print success message."""
+        if args:
+            message = message % args
+        sys.stdout.write(f"[OK] {message}\n")
+
+    def error(self, message, *args):
+        if args:
+            message = message % args
+        sys.stderr.write(f"\033[31m[ERROR] {message}\033[0m\n")
+
+    def warning(self, message, *args):
+        if args:
+            message = message % args
+        sys.stdout.write(f"\033[33m[WARN] {message}\033[0m\n")
+
+    def _debug(self, message, *args):
+        """Print debug message."""
+        if args:
+            message = message % args
+        sys.stdout.write(f"[DEBUG] {message}\n")
+
+    def _progress(self, message, *args):
         """Print progress message."""
-        if self.verbose:
-            print(f"[PROGRESS] {message}")
+        if args:
+            message = message % args
+        sys.stdout.write(f"[PROGRESS] {message}\n")
 
 
 # Global logger instance
@@ -3,12 +3,26 @@
 # Author: @spacemany2k38
 # 2025-12-24
 
+import functools
 import json
+import os
 import re
 from pathlib import Path
-from .paths import get_doc_dir, get_app_dir
+from .filecache import FileCache
+from .paths import PGET_HELPERS, get_doc_dir, get_app_dir
 
+# VERSION: "x.y.z" line of an app's doc YAML. It sits in the header, so
+# only the first DOC_HEAD_SIZE bytes are read and searched.
+_VERSION_RE = re.compile(rb'^VERSION:\s*"([^"]+)"', re.MULTILINE)
+DOC_HEAD_SIZE = 4096
 
+# Parsed metadata files and doc VERSIONs by path, so repeated lookups in
+# one run (list, multi-app install/update) stat instead of re-reading
+_INFO_CACHE = FileCache()
+_DOC_VERSION_CACHE = FileCache()
+
+
+@functools.lru_cache(maxsize=256)
 def get_metadata_file(app_name):
     """Get path to app's metadata file in the app root directory."""
     return get_app_dir(app_name) / ".pget-metadata.json"
@@ -23,11 +37,16 @@ def save_package_info(app_name, version, source_url=None, platform=None):
         'platform': platform,
     }
 
+    data = json.dumps(metadata, indent=2)
+
+    _INFO_CACHE.discard(metadata_file)
     try:
-        # Ensure doc directory exists
-        metadata_file.parent.mkdir(parents=True, exist_ok=True)
-        with metadata_file.open('w') as f:
-            json.dump(metadata, f, indent=2)
+        try:
+            metadata_file.write_text(data)
+        except FileNotFoundError:
+            # App directory not created yet (normally it already holds docs)
+            metadata_file.parent.mkdir(parents=True, exist_ok=True)
+            metadata_file.write_text(data)
     except OSError:
         # Best effort; don't crash
         pass
@@ -35,22 +54,37 @@ def save_package_info(app_name, version, source_url=None, platform=None):
 
 def get_package_info(app_name):
     """Get package installation metadata."""
-    metadata_file = get_metadata_file(app_name)
-
-    if not metadata_file.exists():
-        return None
-
     try:
-        with metadata_file.open('r') as f:
-            return json.load(f)
+        return _INFO_CACHE.get(get_metadata_file(app_name), _load_json)
     except (json.JSONDecodeError, OSError):
         return None
 
 
-def get_package_version(app_name):
-    """Get installed package version from metadata or doc file."""
+def _load_json(path):
+    # One read of the whole (small) file; json.loads decodes UTF-8 bytes
+    with open(path, 'rb') as f:
+        return json.loads(f.read())
+
+
+def read_doc_version(path):
+    """Return the VERSION declared in the doc YAML at path, or None.
+
+    Raises:
+        OSError if path cannot be read
+    """
+    with open(path, 'rb') as f:
+        match = _VERSION_RE.search(f.read(DOC_HEAD_SIZE))
+    return match.group(1).decode('utf-8', 'replace') if match else None
+
+
+def get_package_version(app_name, pkg_info=None):
+    """Get installed package version from metadata or doc file.
+
+    Pass pkg_info if the caller has already loaded it.
+    """
     # Try metadata file first (more reliable for binary installs)
-    pkg_info = get_package_info(app_name)
+    if pkg_info is None:
+        pkg_info = get_package_info(app_name)
     if pkg_info and 'version' in pkg_info:
         version = pkg_info['version']
         # Strip 'v' prefix if present
@@ -62,24 +96,35 @@ def get_package_version(app_name):
     doc_dir = get_doc_dir(app_name)
     doc_file = doc_dir / f"{app_name}.yaml"
 
-    if not doc_file.exists():
-        return 'unknown'
+    try:
+        version = _DOC_VERSION_CACHE.get(doc_file, read_doc_version)
+    except OSError:
+        version = None
+
+    return version or 'unknown'
+
 
+def get_all_package_versions():
+    """Get {app_name: version} for every app with a helper directory.
+
+    Lists ~/.pget/helpers once instead of resolving each name separately;
+    apps missing from the result have no metadata ('unknown').
+    """
+    versions = {}
     try:
-        content = doc_file.read_text()
-        # Extract VERSION from YAML doc
-        match = re.search(r'^VERSION:\s*"([^"]+)"', content, re.MULTILINE)
-        if match:
-            return match.group(1)
-    except (OSError, UnicodeDecodeError):
+        with os.scandir(PGET_HELPERS) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    versions[entry.name] = get_package_version(entry.name)
+    except FileNotFoundError:
         pass
-
-    return 'unknown'
+    return versions
 
 
 def remove_package_info(app_name):
     """Remove package metadata."""
     metadata_file = get_metadata_file(app_name)
+    _INFO_CACHE.discard(metadata_file)
     if metadata_file.exists():
         try:
             metadata_file.unlink()
@@ -3,21 +3,25 @@
 # Author: @spacemany2k38
 # 2025-12-24
 
+import functools
 import os
-import platform as _platform
-import tempfile
 from pathlib import Path
 
 
 PGET_ROOT = Path.home() / ".pget"
 PGET_BIN = PGET_ROOT / "bin"
 PGET_HELPERS = PGET_ROOT / "helpers"
+PGET_CACHE = PGET_ROOT / "cache"
 PGET_PATH_LINE = 'export PATH="$HOME/.pget/bin:$PATH"'
 SYSTEM_PATH_FILE = Path("/etc/paths.d/pget")
 LINUX_PROFILE_FILE = Path("/etc/profile.d/pget.sh")
 # Preferred system bin for sudo installs (POSIX). None if not applicable.
 SYSTEM_BIN = Path("/usr/local/bin") if os.name != "nt" else None
 
+_PGET_PATH_BYTES = PGET_PATH_LINE.encode()
+# rc file -> mtime_ns when it was last seen to contain PGET_PATH_LINE
+_RC_HAS_PGET = {}
+
 
 def ensure_dirs():
     """Create pget directories if they don't exist."""
@@ -40,15 +44,33 @@ def ensure_path_in_shell():
 
     for rc in rc_candidates:
         try:
-            existing = rc.read_text() if rc.exists() else ""
-            if PGET_PATH_LINE not in existing:
-                with rc.open("a") as f:
-                    f.write("\n" + PGET_PATH_LINE + "\n")
+            if _rc_has_path_line(rc):
+                continue
+            with rc.open("a") as f:
+                f.write("\n" + PGET_PATH_LINE + "\n")
         except OSError:
             # Best-effort; do not crash install
             continue
 
 
+def _rc_has_path_line(rc):
+    """Whether rc exists and already contains PGET_PATH_LINE.
+
+    A file seen to contain it is not read again until its mtime changes.
+    """
+    try:
+        mtime = rc.stat().st_mtime_ns
+    except FileNotFoundError:
+        return False
+    if _RC_HAS_PGET.get(rc) == mtime:
+        return True
+    with rc.open("rb") as f:
+        found = _PGET_PATH_BYTES in f.read()
+    if found:
+        _RC_HAS_PGET[rc] = mtime
+    return found
+
+
 def ensure_system_path():
     """Attempt to add ~/.pget/bin to system PATH via OS-appropriate mechanism.
 
@@ -56,6 +78,8 @@ def ensure_system_path():
     Linux: writes /etc/profile.d/pget.sh
     Falls back to per-user shell RC if not permitted.
     """
+    import platform as _platform
+
     if _platform.system() == "Darwin":
         return _ensure_system_path_macos()
     return _ensure_system_path_linux()
@@ -170,10 +194,35 @@ def find_existing_binary(app_name):
     return None
 
 
+# Apps whose temp cache directory this process has already created
+_ENSURED_TEMP_DIRS = set()
+
+
 def get_temp_cache_dir(app_name):
     """Get temporary cache directory for app (auto-cleaned on reboot)."""
+    import tempfile
+
+    cache_dir = Path(tempfile.gettempdir()) / "pget" / app_name
+    if app_name not in _ENSURED_TEMP_DIRS:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        _ENSURED_TEMP_DIRS.add(app_name)
+    return cache_dir
+
+
+def clear_temp_cache_dir(app_name):
+    """Delete app's temporary cache directory.
+
+    Returns:
+        The removed directory, or None if there was none
+    """
+    import tempfile
+    from .fastcopy import fast_rmtree
+
+    _ENSURED_TEMP_DIRS.discard(app_name)
     cache_dir = Path(tempfile.gettempdir()) / "pget" / app_name
-    cache_dir.mkdir(parents=True, exist_ok=True)
+    if not cache_dir.exists():
+        return None
+    fast_rmtree(cache_dir)
     return cache_dir
 
 
@@ -182,6 +231,31 @@ def get_cache_path(app_name, filename):
     return get_temp_cache_dir(app_name) / filename
 
 
+def get_download_dir(app_name):
+    """Get app's release asset cache in ~/.pget/cache/downloads/.
+
+    Unlike the temp cache it survives uninstall, so the reinstall done
+    by update, downgrade or install app@ver can reuse an asset.
+    """
+    return PGET_CACHE / "downloads" / app_name
+
+
+def clear_download_dir(app_name):
+    """Delete app's cached release assets.
+
+    Returns:
+        The removed directory, or None if there was none
+    """
+    from .fastcopy import fast_rmtree
+
+    download_dir = get_download_dir(app_name)
+    if not download_dir.exists():
+        return None
+    fast_rmtree(download_dir)
+    return download_dir
+
+
+@functools.lru_cache(maxsize=256)
 def get_app_dir(app_name):
     """Get path to app's helper directory in ~/.pget/helpers/."""
     return PGET_HELPERS / app_name
@@ -192,6 +266,11 @@ def get_doc_dir(app_name):
     return get_app_dir(app_name) / "doc"
 
 
+def get_doc_fingerprint_file(app_name):
+    """Get path to the fingerprint of the app's installed documentation."""
+    return get_app_dir(app_name) / ".doc-fingerprint"
+
+
 def get_data_dir(app_name):
     """Get path to app's data directory (for databases, persistent storage)."""
     return get_app_dir(app_name) / "data"
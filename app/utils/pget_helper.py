@@ -14,6 +14,7 @@ Example usage in your app:
     config_path = app.config_dir / "settings.json"
 """
 
+from functools import cached_property
 from pathlib import Path
 import sys
 
@@ -21,6 +22,9 @@ import sys
 class PgetApp:
     """Helper class for pget apps to access their directories."""
 
+    # ~/.pget/helpers, joined once rather than per instance
+    _HELPERS = Path.home() / ".pget" / "helpers"
+
     def __init__(self, app_name=None):
         """Initialize with app name (auto-detects if not provided)."""
         if app_name is None:
@@ -28,14 +32,38 @@ class PgetApp:
             app_name = Path(sys.argv[0]).stem
 
         self.app_name = app_name
-        self.pget_root = Path.home() / ".pget"
-        self.app_root = self.pget_root / "helpers" / app_name
-
-        # Standard directories
-        self.data_dir = self.app_root / "data"
-        self.config_dir = self.app_root / "config"
-        self.cache_dir = self.app_root / "cache"
-        self.doc_dir = self.app_root / "doc"
+        self.pget_root = self._HELPERS.parent
+        self.app_root = self._HELPERS / app_name
+
+        # Directories known to exist, so get_*_file skips the mkdir
+        self._ensured = {'data': False, 'config': False, 'cache': False}
+
+    # Standard directories, built on first use
+    @cached_property
+    def data_dir(self):
+        """Data directory (databases, persistent storage)."""
+        return self.app_root / "data"
+
+    @cached_property
+    def config_dir(self):
+        """Config directory (user settings)."""
+        return self.app_root / "config"
+
+    @cached_property
+    def cache_dir(self):
+        """Cache directory (temporary data)."""
+        return self.app_root / "cache"
+
+    @cached_property
+    def doc_dir(self):
+        """Documentation directory installed by pget."""
+        return self.app_root / "doc"
+
+    def _ensure(self, kind):
+        """Create the data/config/cache directory once per instance."""
+        if not self._ensured[kind]:
+            getattr(self, f"{kind}_dir").mkdir(parents=True, exist_ok=True)
+            self._ensured[kind] = True
 
     def ensure_dirs(self, data=True, config=True, cache=True):
         """Create app directories as needed.
@@ -46,11 +74,11 @@ class PgetApp:
             cache: Create cache directory (default: True)
         """
         if data:
-            self.data_dir.mkdir(parents=True, exist_ok=True)
+            self._ensure('data')
         if config:
-            self.config_dir.mkdir(parents=True, exist_ok=True)
+            self._ensure('config')
         if cache:
-            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._ensure('cache')
 
     def clear_cache(self):
         """Clear the cache directory."""
@@ -58,20 +86,21 @@ class PgetApp:
         if self.cache_dir.exists():
             shutil.rmtree(self.cache_dir)
             self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._ensured['cache'] = True
 
     def get_data_file(self, filename):
         """Get path to a file in the data directory."""
-        self.data_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure('data')
         return self.data_dir / filename
 
     def get_config_file(self, filename):
         """Get path to a file in the config directory."""
-        self.config_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure('config')
         return self.config_dir / filename
 
     def get_cache_file(self, filename):
         """Get path to a file in the cache directory."""
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure('cache')
         return self.cache_dir / filename
 
 
@@ -85,7 +114,7 @@ def get_app_dirs(app_name=None):
     if app_name is None:
         app_name = Path(sys.argv[0]).stem
 
-    base = Path.home() / ".pget" / "helpers" / app_name
+    base = PgetApp._HELPERS / app_name
 
     return {
         'base': base,
@@ -3,40 +3,44 @@
 # Author: @spacemany2k38
 # 2025-12-24
 
+import functools
 import sys
 import platform
 
 
+# platform.machine() spellings -> architecture used in release asset names
+_ARCH_MAP = {
+    "x86_64": "x86_64",
+    "amd64": "x86_64",
+    "arm64": "arm64",
+    "aarch64": "arm64",
+    "i386": "i386",
+    "i686": "i386",
+}
+
+
+@functools.lru_cache(maxsize=1)
 def get_os():
-    """Get operating system name."""
-    system = platform.system().lower()
-    if system == "darwin":
-        return "darwin"
-    elif system == "linux":
-        return "linux"
-    elif system == "windows":
-        return "windows"
-    else:
-        return system
+    """Get operating system name (cached, like get_platform_string).
+
+    darwin, linux and windows; any other system under its own name.
+    """
+    return platform.system().lower()
 
 
+@functools.lru_cache(maxsize=1)
 def get_arch():
-    """Get system architecture."""
+    """Get system architecture (cached, like get_platform_string)."""
     machine = platform.machine().lower()
-
-    # Normalize architecture names
-    if machine in ("x86_64", "amd64"):
-        return "x86_64"
-    elif machine in ("arm64", "aarch64"):
-        return "arm64"
-    elif machine in ("i386", "i686"):
-        return "i386"
-    else:
-        return machine
+    return _ARCH_MAP.get(machine, machine)
 
 
+@functools.lru_cache(maxsize=1)
 def get_platform_string():
-    """Get platform string in format: os-arch (e.g., darwin-arm64)."""
+    """Get platform string in format: os-arch (e.g., darwin-arm64).
+
+    Cached: the platform cannot change while pget is running.
+    """
     return f"{get_os()}-{get_arch()}"
 
 
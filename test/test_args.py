@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Author: @spacemany2k38
+# 2026-10-15
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.utils.args import parse_names
+
+
+class TestParseNames(unittest.TestCase):
+    """Test cases for app name argument parsing."""
+
+    def test_commas_and_separate_args(self):
+        """Test comma lists, separate args, spaces and empty parts."""
+        self.assertEqual(
+            parse_names(['yday,see', ' web ', ',,pget,']),
+            ['yday', 'see', 'web', 'pget'],
+        )
+
+    def test_empty(self):
+        """Test no usable names."""
+        self.assertEqual(parse_names([]), [])
+        self.assertEqual(parse_names([' , ']), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Author: @spacemany2k38
+# 2026-10-15
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.utils import doc_reader
+from app.utils.doc_reader import parse_yaml, read_app_doc
+
+
+class TestParseYaml(unittest.TestCase):
+    """Test cases for the app documentation parser."""
+
+    def test_scalars_lists_and_multiline(self):
+        """Test the three supported value forms."""
+        doc = parse_yaml(
+            'NAME: pget\n'
+            'VERSION: "0.2.8"\n'
+            'DESCRIPTION: >\n'
+            '  Pure Python\n'
+            '  package manager\n'
+            'USAGE:\n'
+            '  - pget install <app>\n'
+            "  - 'pget list'\n"
+        )
+        self.assertEqual(doc, {
+            'NAME': 'pget',
+            'VERSION': '0.2.8',
+            'DESCRIPTION': 'Pure Python package manager',
+            'USAGE': ['pget install <app>', 'pget list'],
+        })
+
+    def test_only_caps_keys_at_column_zero(self):
+        """Test lowercase, digit and indented keys are not top-level keys."""
+        doc = parse_yaml(
+            'NAME:pget\n'
+            'name: other\n'
+            'V2: x\n'
+            '  INDENTED: y\n'
+            'SOME_KEY:\n'
+        )
+        self.assertEqual(doc, {'NAME': 'pget', 'SOME_KEY': []})
+
+
+class TestReadAppDoc(unittest.TestCase):
+    """Test cases for bundled doc lookup."""
+
+    def test_bundled_doc(self):
+        """Test pget's own doc is found in the source tree."""
+        self.assertEqual(read_app_doc('pget').get('NAME'), 'pget')
+
+    def test_doc_dirs_listed_once(self):
+        """Test lookups use one listing of the doc dirs until invalidated."""
+        with tempfile.TemporaryDirectory() as tmp, \
+                mock.patch.object(doc_reader, '_DOC_DIRS', (tmp,)):
+            doc_reader.invalidate()
+            self.assertEqual(read_app_doc('later'), {})
+            Path(tmp, 'later.yaml').write_text('NAME: later\n')
+            self.assertEqual(read_app_doc('later'), {})
+            doc_reader.invalidate()
+            self.assertEqual(read_app_doc('later'), {'NAME': 'later'})
+        doc_reader.invalidate()
+
+
+if __name__ == '__main__':
+    unittest.main()
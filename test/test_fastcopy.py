@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Author: @spacemany2k38
+# 2026-10-15
+
+import errno
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.utils import fastcopy
+from app.utils.fastcopy import (
+    fast_copy, fast_rmtree, install_file, parallel_copytree,
+)
+
+
+class TestFastCopy(unittest.TestCase):
+    """Test cases for the kernel-side file copy helper."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.src = self.root / "src"
+        self.src.write_bytes(os.urandom(300 * 1024))
+        self.src.chmod(0o750)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_copies_contents_and_mode(self):
+        """Test contents and permission bits are copied."""
+        dst = self.root / "dst"
+        self.assertEqual(fast_copy(self.src, dst), dst)
+        self.assertEqual(dst.read_bytes(), self.src.read_bytes())
+        self.assertEqual(dst.stat().st_mode & 0o777, 0o750 & ~_umask())
+
+    def test_explicit_mode_ignores_umask(self):
+        """Test an explicit mode is applied exactly, even to an existing file."""
+        dst = self.root / "dst"
+        dst.write_bytes(b"old")
+        dst.chmod(0o600)
+        old_mask = os.umask(0o077)
+        try:
+            fast_copy(self.src, dst, 0o755)
+        finally:
+            os.umask(old_mask)
+        self.assertEqual(dst.stat().st_mode & 0o777, 0o755)
+
+    def test_falls_back_when_kernel_copy_unsupported(self):
+        """Test an EXDEV from copy_file_range falls back to sendfile."""
+        dst = self.root / "dst"
+        error = OSError(errno.EXDEV, "cross-device")
+        with mock.patch.object(fastcopy.os, 'copy_file_range',
+                               side_effect=error, create=True):
+            fast_copy(self.src, dst)
+        self.assertEqual(dst.read_bytes(), self.src.read_bytes())
+
+    def test_falls_back_to_buffered_copy(self):
+        """Test a userspace copy when neither kernel copy is usable."""
+        dst = self.root / "dst"
+        with mock.patch.object(fastcopy.os, 'copy_file_range',
+                               side_effect=OSError(errno.ENOSYS, "nosys"),
+                               create=True), \
+                mock.patch.object(fastcopy.os, 'sendfile',
+                                  side_effect=OSError(errno.EINVAL, "inval"),
+                                  create=True):
+            fast_copy(self.src, dst)
+        self.assertEqual(dst.read_bytes(), self.src.read_bytes())
+
+    def test_overwrites_existing_file(self):
+        """Test a longer existing destination is truncated."""
+        dst = self.root / "dst"
+        dst.write_bytes(b"x" * (400 * 1024))
+        fast_copy(self.src, dst)
+        self.assertEqual(dst.read_bytes(), self.src.read_bytes())
+
+
+class TestInstallFile(unittest.TestCase):
+    """Test cases for the atomic binary install helper."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.src = self.root / "app-1.0-linux-x86_64"
+        self.src.write_bytes(b"new binary")
+        self.dst = self.root / "app"
+        self.dst.write_bytes(b"old binary")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_links_on_same_filesystem(self):
+        """Test dst is replaced by a hard link to an executable src."""
+        self.src.chmod(0o755)
+        install_file(self.src, self.dst)
+        self.assertTrue(os.path.samefile(self.src, self.dst))
+        self.assertEqual(self.dst.stat().st_mode & 0o777, 0o755)
+        self.assertFalse((self.root / ".app.tmp").exists())
+
+    def test_copies_when_mode_differs(self):
+        """Test a src with other permission bits is copied, not changed."""
+        self.src.chmod(0o644)
+        install_file(self.src, self.dst)
+        self.assertFalse(os.path.samefile(self.src, self.dst))
+        self.assertEqual(self.src.stat().st_mode & 0o777, 0o644)
+        self.assertEqual(self.dst.stat().st_mode & 0o777, 0o755)
+        self.assertEqual(self.dst.read_bytes(), b"new binary")
+
+    def test_copies_when_link_disabled(self):
+        """Test link=False copies even a src with matching mode."""
+        self.src.chmod(0o755)
+        install_file(self.src, self.dst, link=False)
+        self.assertFalse(os.path.samefile(self.src, self.dst))
+
+    def test_copies_across_filesystems(self):
+        """Test an EXDEV from link falls back to copying."""
+        self.src.chmod(0o755)
+        with mock.patch.object(fastcopy.os, 'link',
+                               side_effect=OSError(errno.EXDEV, "cross-device")):
+            install_file(self.src, self.dst)
+        self.assertFalse(os.path.samefile(self.src, self.dst))
+        self.assertEqual(self.dst.read_bytes(), b"new binary")
+
+
+class TestParallelCopytree(unittest.TestCase):
+    """Test cases for the thread-pool tree copy."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.src = self.root / "src"
+        for rel in ("app/main.py", "app/sub/util.py", "doc/app.yaml",
+                    "__pycache__/x.pyc", "bazel-out/y"):
+            path = self.src / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(rel)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_copies_tree_honouring_ignore(self):
+        """Test files are copied and ignored names are skipped at any depth."""
+        def ignore(directory, names):
+            return [n for n in names if n == '__pycache__' or n.startswith('bazel-')]
+
+        dst = self.root / "dst"
+        parallel_copytree(self.src, dst, ignore)
+        copied = sorted(
+            str(p.relative_to(dst)) for p in dst.rglob("*") if p.is_file()
+        )
+        self.assertEqual(copied, ["app/main.py", "app/sub/util.py", "doc/app.yaml"])
+        self.assertEqual((dst / "app/sub/util.py").read_text(), "app/sub/util.py")
+
+    def test_existing_destination_fails(self):
+        """Test dst must not exist, as with shutil.copytree."""
+        dst = self.root / "dst"
+        dst.mkdir()
+        with self.assertRaises(FileExistsError):
+            parallel_copytree(self.src, dst)
+
+
+class TestFastRmtree(unittest.TestCase):
+    """Test cases for tree removal."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tree = Path(self._tmp.name) / "tree"
+        (self.tree / "a" / "b").mkdir(parents=True)
+        (self.tree / "a" / "b" / "f").write_text("x")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_removes_tree(self):
+        """Test the whole tree is removed."""
+        fast_rmtree(self.tree)
+        self.assertFalse(self.tree.exists())
+
+    def test_falls_back_without_rm(self):
+        """Test shutil.rmtree is used when rm cannot be found."""
+        with mock.patch('shutil.which', return_value=None), \
+                mock.patch('subprocess.run') as run:
+            fast_rmtree(self.tree)
+        run.assert_not_called()
+        self.assertFalse(self.tree.exists())
+
+
+def _umask():
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Author: @spacemany2k38
+# 2026-10-15
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core import gh_cache
+
+
+class TestGhCache(unittest.TestCase):
+    """Test cases for the GitHub response cache."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self._orig_dir = gh_cache.GH_CACHE_DIR
+        gh_cache.GH_CACHE_DIR = Path(self._tmp.name) / "gh"
+        self.calls = []
+
+    def tearDown(self):
+        gh_cache.GH_CACHE_DIR = self._orig_dir
+        self._tmp.cleanup()
+
+    def _fetcher(self, status, etag, body):
+        def fetch(url, headers):
+            self.calls.append(dict(headers))
+            return status, etag, body
+        return fetch
+
+    def test_fresh_entry_skips_network(self):
+        """Test a fresh entry is served without calling fetch."""
+        url = "https://api.github.com/repos/pynosaur/yday"
+        gh_cache.cached_get(url, self._fetcher(200, '"abc"', {"x": 1}))
+        body = gh_cache.cached_get(url, self._fetcher(500, None, None))
+        self.assertEqual(body, {"x": 1})
+        self.assertEqual(len(self.calls), 1, "Second call should hit the cache")
+
+    def test_stale_entry_revalidates(self):
+        """Test a stale entry sends If-None-Match and reuses body on 304."""
+        url = "https://api.github.com/repos/pynosaur/yday"
+        gh_cache.cached_get(url, self._fetcher(200, '"abc"', {"x": 1}))
+        body = gh_cache.cached_get(url, self._fetcher(304, '"abc"', None), ttl=0)
+        self.assertEqual(body, {"x": 1})
+        self.assertEqual(self.calls[-1], {'If-None-Match': '"abc"'})
+
+    def test_missing_not_cached(self):
+        """Test 404 responses are not cached."""
+        url = "https://api.github.com/repos/pynosaur/nope"
+        self.assertIsNone(gh_cache.cached_get(url, self._fetcher(404, None, None)))
+        gh_cache.cached_get(url, self._fetcher(404, None, None))
+        self.assertEqual(len(self.calls), 2, "404 should not be served from cache")
+        self.assertEqual(gh_cache.clear(), 0)
+
+    def test_failed_store_leaves_no_temp_file(self):
+        """Test a body json can't encode is not cached and leaves no file."""
+        url = "https://api.github.com/repos/pynosaur/yday"
+        body = {"x": object()}
+        self.assertIs(gh_cache.cached_get(url, self._fetcher(200, None, body)), body)
+        self.assertEqual(list(gh_cache.GH_CACHE_DIR.iterdir()), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
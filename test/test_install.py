@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Author: @spacemany2k38
+# 2026-10-15
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.commands import install
+from app.commands.install import _parse_names
+from app.core import installer
+from app.utils import paths
+
+
+class TestParseNames(unittest.TestCase):
+    """Test cases for install name/version parsing."""
+
+    def test_comma_separated(self):
+        """Test comma-separated names with optional versions."""
+        self.assertEqual(
+            _parse_names(['a@1.0,b@2.0,c,d@3']),
+            [('a', '1.0'), ('b', '2.0'), ('c', None), ('d', '3')],
+        )
+
+    def test_separate_args_and_spaces(self):
+        """Test separate args, stray spaces and empty parts."""
+        self.assertEqual(
+            _parse_names(['yday', ' see , ', ',,pget@v0.2.8']),
+            [('yday', None), ('see', None), ('pget', 'v0.2.8')],
+        )
+
+    def test_malformed_specs_are_kept(self):
+        """Test odd specs are passed through whole, not dropped or split."""
+        self.assertEqual(_parse_names(['a b']), [('a b', None)])
+        self.assertEqual(_parse_names(['foo@']), [('foo', '')])
+        self.assertEqual(_parse_names(['@1.0']), [('', '1.0')])
+
+
+class TestInstallFromSource(unittest.TestCase):
+    """Test cases for the script/Bazel fallback decision."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.source = Path(self._tmp.name)
+        self.installer = mock.Mock()
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _install(self, bazel, script_mode=False, build_mode=False):
+        with mock.patch.object(install, 'find_bazel', return_value=bazel), \
+                mock.patch.object(install, 'install_as_script',
+                                  return_value=True) as script:
+            ok = install._install_from_source(
+                self.installer, self.source, 'app', '1.0', '', 'linux-x86_64',
+                script_mode, build_mode,
+            )
+        return ok, script
+
+    def test_build_without_bazel_fails(self):
+        """Test --build without Bazel aborts instead of falling back."""
+        ok, script = self._install(None, build_mode=True)
+        self.assertFalse(ok)
+        script.assert_not_called()
+        self.installer.install_with_bazel.assert_not_called()
+
+    def test_no_bazel_project_falls_back_to_script(self):
+        """Test a source tree without MODULE.bazel/BUILD installs as script."""
+        ok, script = self._install('/usr/bin/bazel')
+        self.assertTrue(ok)
+        script.assert_called_once()
+        self.installer.install_with_bazel.assert_not_called()
+
+    def test_bazel_project_is_built(self):
+        """Test Bazel builds a source tree that has a Bazel project."""
+        (self.source / 'MODULE.bazel').touch()
+        self._install('/usr/bin/bazel')
+        self.installer.install_with_bazel.assert_called_once()
+
+    def test_failed_build_falls_back_to_script(self):
+        """Test a failed Bazel build without --build installs as script."""
+        (self.source / 'MODULE.bazel').touch()
+        self.installer.install_with_bazel.return_value = False
+        ok, script = self._install('/usr/bin/bazel')
+        self.assertTrue(ok)
+        script.assert_called_once()
+
+    def test_failed_forced_build_fails(self):
+        """Test a failed --build does not fall back to a script install."""
+        (self.source / 'MODULE.bazel').touch()
+        self.installer.install_with_bazel.return_value = False
+        ok, script = self._install('/usr/bin/bazel', build_mode=True)
+        self.assertFalse(ok)
+        script.assert_not_called()
+
+
+class TestLoadRegistry(unittest.TestCase):
+    """Test cases for the installed-package lookup."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        root = Path(self._tmp.name)
+        self.system_bin = root / "system"
+        self.pget_bin = root / "pget"
+        self.system_bin.mkdir()
+        self.pget_bin.mkdir()
+        self._patches = [
+            mock.patch.object(paths, 'SYSTEM_BIN', self.system_bin),
+            mock.patch.object(paths, 'PGET_BIN', self.pget_bin),
+            mock.patch.object(installer, 'get_package_version',
+                              side_effect=lambda name: f'{name}-version'),
+        ]
+        for p in self._patches:
+            p.start()
+
+    def tearDown(self):
+        for p in self._patches:
+            p.stop()
+        self._tmp.cleanup()
+
+    def test_only_requested_installed_names(self):
+        """Test system-bin and ~/.pget/bin binaries count, other names don't."""
+        (self.system_bin / 'see').touch()
+        (self.system_bin / 'unrelated').touch()
+        (self.pget_bin / 'yday').touch()
+        registry = installer.Installer().load_registry(['see', 'yday', 'nope'])
+        self.assertEqual(
+            registry, {'see': 'see-version', 'yday': 'yday-version'},
+        )
+        installer.get_package_version.assert_has_calls(
+            [mock.call('see'), mock.call('yday')],
+        )
+        self.assertEqual(installer.get_package_version.call_count, 2)
+
+
+class TestInstallFetched(unittest.TestCase):
+    """Test cases for installing fetched artifacts."""
+
+    def setUp(self):
+        self.installer = mock.Mock()
+        self.fetcher = mock.Mock()
+        self.fetched = {
+            'repo_info': {'html_url': ''},
+            'program_ok': True,
+            'binary_path': None,
+            'binary_version': None,
+            'source_path': None,
+            'source_version': None,
+        }
+
+    def _install(self):
+        return install._install_fetched(
+            self.installer, self.fetcher, 'app', None, self.fetched,
+            'linux-x86_64', False, False, False, replace=True,
+        )
+
+    def test_failed_download_keeps_old_version(self):
+        """Test nothing is uninstalled when the new version didn't download."""
+        self.assertFalse(self._install())
+        self.installer.uninstall.assert_not_called()
+
+    def test_downloaded_version_replaces_old(self):
+        """Test the old version is removed before the new one is installed."""
+        self.fetched['binary_path'] = Path('app-1.0-linux-x86_64')
+        self.fetched['binary_version'] = '1.0'
+        self.assertTrue(self._install())
+        self.installer.uninstall.assert_called_once_with(
+            'app', keep_downloads=True,
+        )
+        self.installer.install_binary.assert_called_once()
+        self.fetcher.download_app_directory.assert_not_called()
+
+    def test_failed_binary_falls_back_to_source(self):
+        """Test the source is fetched when the binary fails to install."""
+        self.fetched['binary_path'] = Path('app-1.0-linux-x86_64')
+        self.installer.install_binary.return_value = False
+        self.fetcher.download_app_directory.return_value = (Path('src'), '1.0')
+        with mock.patch.object(install, '_install_from_source',
+                               return_value=True) as from_source:
+            self.assertTrue(self._install())
+        self.fetcher.download_app_directory.assert_called_once()
+        self.assertEqual(from_source.call_args[0][1], Path('src'))
+
+
+if __name__ == '__main__':
+    unittest.main()
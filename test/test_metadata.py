@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Author: @spacemany2k38
+# 2026-10-15
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.utils import metadata, paths
+
+
+class TestMetadata(unittest.TestCase):
+    """Test cases for package metadata helpers."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        helpers = Path(self._tmp.name) / "helpers"
+        self._patches = [
+            mock.patch.object(paths, 'PGET_HELPERS', helpers),
+            mock.patch.object(metadata, 'PGET_HELPERS', helpers),
+        ]
+        for p in self._patches:
+            p.start()
+        self.helpers = helpers
+        self._clear_path_caches()
+
+    def tearDown(self):
+        for p in self._patches:
+            p.stop()
+        self._clear_path_caches()
+        self._tmp.cleanup()
+
+    @staticmethod
+    def _clear_path_caches():
+        # Both memoize paths under the (patched) PGET_HELPERS
+        paths.get_app_dir.cache_clear()
+        metadata.get_metadata_file.cache_clear()
+
+    def test_all_versions_no_helpers_dir(self):
+        """Test a missing helpers directory yields no versions."""
+        self.assertEqual(metadata.get_all_package_versions(), {})
+
+    def test_all_versions_matches_per_app_lookup(self):
+        """Test the batch scan agrees with get_package_version."""
+        metadata.save_package_info('yday', 'v1.2.0', platform='linux-x86_64')
+        doc_dir = self.helpers / 'see' / 'doc'
+        doc_dir.mkdir(parents=True)
+        (doc_dir / 'see.yaml').write_text('NAME: see\nVERSION: "0.3.1"\n')
+        (self.helpers / 'empty').mkdir()
+
+        versions = metadata.get_all_package_versions()
+        self.assertEqual(
+            versions, {'yday': '1.2.0', 'see': '0.3.1', 'empty': 'unknown'},
+        )
+        for name, version in versions.items():
+            self.assertEqual(metadata.get_package_version(name), version)
+
+    def test_info_reflects_latest_save(self):
+        """Test cached metadata is dropped when it is saved again."""
+        metadata.save_package_info('yday', 'v1.2.0')
+        self.assertEqual(metadata.get_package_version('yday'), '1.2.0')
+        metadata.save_package_info('yday', 'v1.2.1')
+        self.assertEqual(metadata.get_package_version('yday'), '1.2.1')
+        metadata.remove_package_info('yday')
+        self.assertIsNone(metadata.get_package_info('yday'))
+
+    def test_doc_version_follows_file_changes(self):
+        """Test an edited doc file is parsed again."""
+        doc_file = self.helpers / 'see' / 'doc' / 'see.yaml'
+        doc_file.parent.mkdir(parents=True)
+        doc_file.write_text('VERSION: "0.3.1"\n')
+        self.assertEqual(metadata.get_package_version('see'), '0.3.1')
+        doc_file.write_text('VERSION: "0.10.0"\n')
+        self.assertEqual(metadata.get_package_version('see'), '0.10.0')
+
+    def test_read_doc_version_needs_quotes(self):
+        """Test update and list read the same, quoted, VERSION line."""
+        doc_file = self.helpers / 'see.yaml'
+        self.helpers.mkdir()
+        doc_file.write_text('NAME: see\nVERSION: "0.3.1"\n')
+        self.assertEqual(metadata.read_doc_version(doc_file), '0.3.1')
+        doc_file.write_text('NAME: see\nVERSION: 0.3.1\n')
+        self.assertIsNone(metadata.read_doc_version(doc_file))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,12 +4,18 @@
 # 2025-12-24
 
 import sys
+import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from app.utils.paths import PGET_BIN, get_binary_path, get_cache_path
+from app.utils import paths
+from app.utils.paths import (
+    PGET_BIN, clear_download_dir, clear_temp_cache_dir, get_binary_path,
+    get_cache_path, get_download_dir, get_temp_cache_dir,
+)
 
 
 class TestPaths(unittest.TestCase):
@@ -33,6 +39,31 @@ class TestPaths(unittest.TestCase):
         self.assertIn("testapp", path_str, "Cache path should contain app name")
         self.assertIn("testfile", path_str, "Cache path should contain filename")
 
+    def test_temp_cache_dir_recreated_after_clear(self):
+        """Test the temp cache dir exists again after being cleared."""
+        with tempfile.TemporaryDirectory() as tmp, \
+                mock.patch.object(tempfile, 'tempdir', tmp):
+            cache_dir = get_temp_cache_dir("cleartest")
+            self.assertTrue(cache_dir.is_dir())
+            self.assertEqual(clear_temp_cache_dir("cleartest"), cache_dir)
+            self.assertFalse(cache_dir.exists())
+            self.assertIsNone(clear_temp_cache_dir("cleartest"))
+            self.assertTrue(get_temp_cache_dir("cleartest").is_dir())
+
+    def test_download_dir_survives_temp_clear(self):
+        """Test cached release assets are kept when the temp cache is cleared."""
+        with tempfile.TemporaryDirectory() as tmp, \
+                mock.patch.object(tempfile, 'tempdir', tmp), \
+                mock.patch.object(paths, 'PGET_CACHE', Path(tmp) / "cache"):
+            asset = get_download_dir("cleartest") / "cleartest-linux-x86_64"
+            asset.parent.mkdir(parents=True)
+            asset.write_bytes(b"binary")
+            get_temp_cache_dir("cleartest")
+            clear_temp_cache_dir("cleartest")
+            self.assertTrue(asset.exists())
+            self.assertEqual(clear_download_dir("cleartest"), asset.parent)
+            self.assertFalse(asset.parent.exists())
+
 
 if __name__ == '__main__':
     unittest.main()